@@ -262,7 +262,7 @@ class ScheduledTask:
                         for context, validation in result['validation_results'].items():
                             validation_json[context] = {
                                 'is_valid': validation.is_valid,
-                                'errors': validation.errors,
+                                'errors': validation.formatted_errors(),
                                 'warnings': validation.warnings
                             }
                         
@@ -41,40 +41,39 @@ class DocumentReferenceMapper:
             df: DataFrame in ANSE CHASTANET STOCK format
         """
         logger.info(f"Loading document references from DataFrame with {len(df)} rows")
-        
-        for _, row in df.iterrows():
-            try:
-                # Check for required columns
-                if not all(col in df.columns for col in ['C Nbr', 'Office', 'Year']):
-                    logger.warning("Required columns not found in ANSE CHASTANET STOCK data")
-                    continue
-                
-                # Extract key fields
-                product_code = str(row.get('Product', '')).strip()
-                description = str(row.get('Description', '')).strip()
-                c_nbr = str(row.get('C Nbr', '')).strip()
-                office = str(row.get('Office', '')).strip()
-                year = str(row.get('Year', '')).strip()
-                line = str(row.get('Line', '')).strip()
-                
-                if not c_nbr or not office or not year:
-                    continue
-                
-                # Create document reference
-                document_ref = f"{office} {year} C {c_nbr}"
-                if line:
-                    document_ref += f" art. {line}"
-                
-                # Store mappings
-                if product_code:
-                    self.product_to_document[product_code.upper()] = document_ref
-                
-                if description:
-                    self.description_to_document[description.upper()] = document_ref
-                
-            except Exception as e:
-                logger.warning(f"Error processing document reference: {e}")
-        
+
+        # The column check is invariant across rows, so do it once up front
+        if not all(col in df.columns for col in ['C Nbr', 'Office', 'Year']):
+            logger.warning("Required columns not found in ANSE CHASTANET STOCK data")
+            return
+
+        # Build every document reference with columnar string ops instead of
+        # re-extracting fields row by row
+        c_nbr = df['C Nbr'].fillna('').astype(str).str.strip()
+        office = df['Office'].fillna('').astype(str).str.strip()
+        year = df['Year'].fillna('').astype(str).str.strip()
+        if 'Line' in df.columns:
+            line = df['Line'].fillna('').astype(str).str.strip()
+        else:
+            line = pd.Series('', index=df.index)
+
+        document_refs = office + ' ' + year + ' C ' + c_nbr
+        has_line = line != ''
+        document_refs[has_line] = document_refs[has_line] + ' art. ' + line[has_line]
+
+        valid = (c_nbr != '') & (office != '') & (year != '')
+
+        # Store mappings with bulk dict updates over the filtered columns
+        if 'Product' in df.columns:
+            product_codes = df['Product'].fillna('').astype(str).str.strip().str.upper()
+            mask = valid & (product_codes != '')
+            self.product_to_document.update(zip(product_codes[mask], document_refs[mask]))
+
+        if 'Description' in df.columns:
+            descriptions = df['Description'].fillna('').astype(str).str.strip().str.upper()
+            mask = valid & (descriptions != '')
+            self.description_to_document.update(zip(descriptions[mask], document_refs[mask]))
+
         logger.info(f"Loaded {len(self.product_to_document)} product code mappings and {len(self.description_to_document)} description mappings")
     
     def add_document_reference(self, product_code: str, document_ref: str):
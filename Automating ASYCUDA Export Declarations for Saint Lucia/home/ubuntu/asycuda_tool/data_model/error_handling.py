@@ -84,18 +84,21 @@ class ErrorHandler:
         Returns:
             Dictionary with validation details
         """
+        # Render record-based errors alongside plain string ones
+        errors = validation_result.formatted_errors()
+
         # Log validation issues
         if not validation_result.is_valid:
-            logger.warning(f"Validation failed in {context}: {len(validation_result.errors)} errors, {len(validation_result.warnings)} warnings")
-            for error in validation_result.errors:
+            logger.warning(f"Validation failed in {context}: {len(errors)} errors, {len(validation_result.warnings)} warnings")
+            for error in errors:
                 logger.error(f"Validation error: {error}")
             for warning in validation_result.warnings:
                 logger.warning(f"Validation warning: {warning}")
-        
+
         # Create validation details
         validation_details = {
             'is_valid': validation_result.is_valid,
-            'errors': validation_result.errors,
+            'errors': errors,
             'warnings': validation_result.warnings,
             'context': context,
             'timestamp': datetime.now().isoformat()
@@ -281,7 +284,7 @@ class ErrorHandler:
         if validation_result.is_valid:
             return "Validation passed successfully."
         
-        error_count = len(validation_result.errors)
+        error_count = len(validation_result.errors) + len(validation_result.error_records)
         warning_count = len(validation_result.warnings)
         
         message = f"Validation failed with {error_count} errors and {warning_count} warnings."
@@ -354,7 +357,7 @@ class ErrorHandler:
             "sequential": "Fix item numbers to be sequential starting from 1"
         }
         
-        for error in validation_result.errors:
+        for error in validation_result.formatted_errors():
             for pattern, suggestion in error_patterns.items():
                 if pattern.lower() in error.lower() and suggestion not in suggestions:
                     suggestions.append(suggestion)
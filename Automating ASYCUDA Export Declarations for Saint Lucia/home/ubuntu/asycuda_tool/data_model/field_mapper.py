@@ -143,16 +143,21 @@ class FieldMapper:
             date=datetime.now()
         )
         
+        # Filter rows with missing essential data once at the column level,
+        # so str() never runs on NaN sentinels inside the loop
+        if 'ITEM SOLD ' in sales_df.columns and 'DF US$' in sales_df.columns:
+            valid_rows = sales_df[sales_df['ITEM SOLD '].notna() & sales_df['DF US$'].notna()]
+        else:
+            valid_rows = sales_df.iloc[0:0]
+        skipped = len(sales_df) - len(valid_rows)
+        if skipped:
+            logger.debug(f"Skipping {skipped} rows due to missing essential data")
+
         # Process each sales record
-        for idx, row in sales_df.iterrows():
+        for idx, row in valid_rows.iterrows():
             try:
-                # Skip rows with missing essential data
-                if pd.isna(row.get('ITEM SOLD ')) or pd.isna(row.get('DF US$')):
-                    logger.debug(f"Skipping row {idx} due to missing essential data")
-                    continue
-                
                 # Extract basic item data
-                description = str(row.get('ITEM SOLD ', '')).strip()
+                description = str(row['ITEM SOLD ']).strip()
                 bar_code = str(row.get('BAR CODE', '')).strip() if not pd.isna(row.get('BAR CODE')) else ""
                 value = float(row.get('DF US$', 0))
                 quantity = float(row.get('number', 1)) if not pd.isna(row.get('number')) else 1
@@ -162,13 +167,13 @@ class FieldMapper:
                 # Get HS code and related details
                 hs_match = self.hs_lookup.lookup_hs_code(description)
                 hs_code = hs_match['hs_code']
-                origin = hs_match.get('details', {}).get('origin', self.defaults['country_of_origin'])
+                origin = getattr(hs_match.get('details'), 'origin', '') or self.defaults['country_of_origin']
                 
                 logger.debug(f"HS code match: {hs_code}, origin: {origin}, method: {hs_match['method']}, confidence: {hs_match['confidence']}")
                 
                 # Estimate weights
-                weights = self.weight_estimator.estimate_weights(hs_code, description, quantity)
-                logger.debug(f"Estimated weights: gross={weights['gross']}, net={weights['net']}")
+                gross_weight, net_weight = self.weight_estimator.estimate_weights(hs_code, description, quantity)
+                logger.debug(f"Estimated weights: gross={gross_weight}, net={net_weight}")
                 
                 # Get previous document reference
                 prev_doc = self.document_mapper.get_document_reference(
@@ -184,8 +189,8 @@ class FieldMapper:
                     hs_code=hs_code,
                     description=description,
                     country_of_origin=origin,
-                    gross_weight=weights['gross'],
-                    net_weight=weights['net'],
+                    gross_weight=gross_weight,
+                    net_weight=net_weight,
                     statistical_unit=self.defaults['statistical_unit'],
                     quantity=quantity,
                     customs_value=value,
@@ -45,8 +45,9 @@ class FieldConstraints:
         'previous_document': 50,
     }
     
-    # Regular expression patterns for field validation
-    PATTERNS = {
+    # Regular expression patterns for field validation, compiled once at
+    # class creation so each check goes straight to the pattern's match method
+    _PATTERNS = {name: re.compile(pattern) for name, pattern in {
         'registration_number': r'^[A-Z0-9]+$',
         'declaration_type': r'^EX[1-3]$',
         'customs_office': r'^LC[A-Z]{2,3}$',
@@ -57,8 +58,32 @@ class FieldConstraints:
         'hs_code': r'^\d{6,10}$',
         'numeric': r'^\d+(\.\d+)?$',
         'date': r'^\d{2}/\d{2}/\d{4}$',
+    }.items()}
+
+    # Hand-written checks for the fixed-shape codes; equivalent to the
+    # patterns above but without entering the regex engine. Patterns not
+    # listed here (numeric, date) fall through to the compiled regex.
+    _FAST_CHECKS = {
+        'registration_number':
+            lambda v: bool(v) and v.isascii() and v.isalnum()
+            and (v.isupper() or v.isdigit()),
+        'declaration_type':
+            lambda v: len(v) == 3 and v[:2] == 'EX' and v[2] in '123',
+        'customs_office':
+            lambda v: 4 <= len(v) <= 5 and v[:2] == 'LC'
+            and v[2:].isascii() and v[2:].isalpha() and v[2:].isupper(),
+        'general_procedure_code':
+            lambda v: len(v) == 4 and v.isascii() and v.isdigit(),
+        'extended_procedure_code':
+            lambda v: len(v) == 3 and v.isascii() and v.isdigit(),
+        'country_code':
+            lambda v: len(v) == 2 and v.isascii() and v.isalpha() and v.isupper(),
+        'currency_code':
+            lambda v: len(v) == 3 and v.isascii() and v.isalpha() and v.isupper(),
+        'hs_code':
+            lambda v: 6 <= len(v) <= 10 and v.isascii() and v.isdigit(),
     }
-    
+
     # Required fields for declaration
     REQUIRED_DECLARATION_FIELDS = [
         'registration_number',
@@ -123,8 +148,16 @@ class FieldConstraints:
         Returns:
             True if valid, raises exception otherwise
         """
-        pattern = cls.PATTERNS.get(pattern_name)
-        if pattern and not re.match(pattern, str(value)):
+        fast_check = cls._FAST_CHECKS.get(pattern_name)
+        if fast_check is not None:
+            if not fast_check(str(value)):
+                raise FieldValidationError(
+                    f"Value '{value}' does not match required pattern for {pattern_name}"
+                )
+            return True
+
+        pattern = cls._PATTERNS.get(pattern_name)
+        if pattern is not None and pattern.match(str(value)) is None:
             raise FieldValidationError(
                 f"Value '{value}' does not match required pattern for {pattern_name}"
             )
@@ -170,18 +203,27 @@ class FieldConstraints:
             return True
         
         if isinstance(value, str):
-            try:
-                # Try to parse date string in DD/MM/YYYY format
-                if re.match(r'^\d{2}/\d{2}/\d{4}$', value):
-                    day, month, year = map(int, value.split('/'))
-                    datetime(year, month, day)
+            # Try DD/MM/YYYY first: shape-check by slicing and convert the
+            # pieces directly instead of a regex pass followed by split.
+            # isdecimal guards each piece because int() alone would accept
+            # leading whitespace and signs the old regex rejected
+            if (len(value) == 10 and value[2] == '/' and value[5] == '/'
+                    and value[0:2].isdecimal() and value[3:5].isdecimal()
+                    and value[6:10].isdecimal()):
+                try:
+                    datetime(int(value[6:10]), int(value[3:5]), int(value[0:2]))
                     return True
-                # Try to parse ISO format
-                datetime.fromisoformat(value.replace('Z', '+00:00'))
+                except ValueError:
+                    pass
+            # Try ISO format, only rewriting the 'Z' suffix when present
+            try:
+                datetime.fromisoformat(
+                    value[:-1] + '+00:00' if value.endswith('Z') else value
+                )
                 return True
             except (ValueError, TypeError):
                 pass
-        
+
         raise FieldValidationError(
             f"Field '{field_name}' must be a valid date"
         )
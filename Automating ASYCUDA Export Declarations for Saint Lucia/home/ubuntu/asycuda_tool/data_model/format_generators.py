@@ -13,9 +13,12 @@ Each generator takes a Declaration object and produces the corresponding output
 from typing import Dict, List, Any, Optional, BinaryIO, TextIO
 import xml.dom.minidom as minidom
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
 import csv
 import io
 import datetime
+import operator
+import zipfile
 from .asycuda_data_model import Declaration, Item
 
 
@@ -24,6 +27,108 @@ class FormatGeneratorError(Exception):
     pass
 
 
+# Pre-built template for the repeating per-item XML block. Formatting a
+# constant template is far cheaper than building ~14 SubElements per item.
+_ITEM_TEMPLATE = (
+    "    <Item>\n"
+    "      <ItemNumber>{item_number}</ItemNumber>\n"
+    "      <HSCode>{hs_code}</HSCode>\n"
+    "      <Description>{description}</Description>\n"
+    "      <CountryOfOrigin>{country_of_origin}</CountryOfOrigin>\n"
+    "      <GrossWeight>{gross_weight}</GrossWeight>\n"
+    "      <NetWeight>{net_weight}</NetWeight>\n"
+    "      <StatisticalUnit>{statistical_unit}</StatisticalUnit>\n"
+    "      <Quantity>{quantity}</Quantity>\n"
+    "      <CustomsValue>{customs_value}</CustomsValue>\n"
+    "      <PackageType>{package_type}</PackageType>\n"
+    "      <PackageCount>{package_count}</PackageCount>\n"
+    "      <MarksAndNumbers>{marks_and_numbers}</MarksAndNumbers>\n"
+    "{previous_document}"
+    "    </Item>\n"
+)
+
+_PREVIOUS_DOC_TEMPLATE = "      <PreviousDocument>{0}</PreviousDocument>\n"
+
+# Batched attribute fetch for item rows; one C-level call instead of 13
+# Python-level attribute lookups per item
+_ITEM_FIELDS = operator.attrgetter(
+    "item_number", "hs_code", "description", "country_of_origin",
+    "gross_weight", "net_weight", "statistical_unit", "quantity",
+    "customs_value", "package_type", "package_count", "marks_and_numbers",
+    "previous_document"
+)
+
+
+def _pipe_item_rows(items):
+    """Yield pipe-delimited item rows for csv.writer.writerows."""
+    fields = _ITEM_FIELDS
+    to_str = str
+    for item in items:
+        (item_number, hs_code, description, country_of_origin, gross_weight,
+         net_weight, statistical_unit, quantity, customs_value, package_type,
+         package_count, marks_and_numbers, previous_document) = fields(item)
+        yield (
+            "I",  # Item indicator
+            to_str(item_number),
+            hs_code,
+            description,
+            country_of_origin,
+            to_str(gross_weight),
+            to_str(net_weight),
+            statistical_unit,
+            to_str(quantity),
+            to_str(customs_value),
+            package_type,
+            to_str(package_count),
+            marks_and_numbers,
+            previous_document or ""
+        )
+
+
+# Column headers for the Items sheet in Excel output
+ITEM_HEADERS = (
+    "Item #", "HS Code", "Description", "Origin", "Gross Weight", "Net Weight",
+    "Unit", "Quantity", "Value", "Package Type", "Packages", "Marks",
+    "Previous Doc"
+)
+
+def _fmt_num_cell(value):
+    """Format a numeric value as an XLSX number cell."""
+    return f'<c t="n"><v>{value}</v></c>'
+
+
+def _fmt_str_cell(value):
+    """Format a value as an XLSX inline-string cell."""
+    return f'<c t="inlineStr"><is><t>{xml_escape(str(value))}</t></is></c>'
+
+
+# Per-column cell formatters for the fast Items sheet, aligned with
+# ITEM_HEADERS; knowing each column's type up front replaces an isinstance
+# dispatch per cell with one direct call
+ITEM_COLUMN_FORMATTERS = (
+    _fmt_num_cell,  # Item #
+    _fmt_str_cell,  # HS Code
+    _fmt_str_cell,  # Description
+    _fmt_str_cell,  # Origin
+    _fmt_num_cell,  # Gross Weight
+    _fmt_num_cell,  # Net Weight
+    _fmt_str_cell,  # Unit
+    _fmt_num_cell,  # Quantity
+    _fmt_num_cell,  # Value
+    _fmt_str_cell,  # Package Type
+    _fmt_num_cell,  # Packages
+    _fmt_str_cell,  # Marks
+    _fmt_str_cell,  # Previous Doc
+)
+
+# Fixed column widths (points) for the PDF item table, matching the ASYCUDA
+# form geometry. Passing these to LongTable skips reportlab's width solver,
+# which would otherwise hydrate the whole table up front to measure it.
+PDF_ITEM_COL_WIDTHS = (
+    30, 50, 110, 35, 45, 45, 30, 40, 45, 45, 40, 50, 65
+)
+
+
 class XmlGenerator:
     """
     Generates XML format for ASYCUDA import.
@@ -96,29 +201,39 @@ class XmlGenerator:
         if declaration.declarant_signature:
             ET.SubElement(details, "DeclarantSignature").text = declaration.declarant_signature
         
-        # Add items
-        items_element = ET.SubElement(root, "Items")
-        for item in declaration.items:
-            item_element = ET.SubElement(items_element, "Item")
-            ET.SubElement(item_element, "ItemNumber").text = str(item.item_number)
-            ET.SubElement(item_element, "HSCode").text = item.hs_code
-            ET.SubElement(item_element, "Description").text = item.description
-            ET.SubElement(item_element, "CountryOfOrigin").text = item.country_of_origin
-            ET.SubElement(item_element, "GrossWeight").text = str(item.gross_weight)
-            ET.SubElement(item_element, "NetWeight").text = str(item.net_weight)
-            ET.SubElement(item_element, "StatisticalUnit").text = item.statistical_unit
-            ET.SubElement(item_element, "Quantity").text = str(item.quantity)
-            ET.SubElement(item_element, "CustomsValue").text = str(item.customs_value)
-            ET.SubElement(item_element, "PackageType").text = item.package_type
-            ET.SubElement(item_element, "PackageCount").text = str(item.package_count)
-            ET.SubElement(item_element, "MarksAndNumbers").text = item.marks_and_numbers
-            if item.previous_document:
-                ET.SubElement(item_element, "PreviousDocument").text = item.previous_document
-        
-        # Convert to pretty XML and write to file
+        # Convert the header sections to pretty XML; the repeating items block
+        # is emitted below as formatted text, bypassing the element tree
         xml_string = ET.tostring(root, encoding="utf-8")
         pretty_xml = minidom.parseString(xml_string).toprettyxml(indent="  ")
-        output_file.write(pretty_xml)
+        head, closing_tag, tail = pretty_xml.rpartition("</AsycudaDeclaration>")
+        output_file.write(head)
+
+        # Add items with a tight template-formatting loop
+        output_file.write("  <Items>\n")
+        escape = xml_escape
+        for item in declaration.items:
+            previous_document = (
+                _PREVIOUS_DOC_TEMPLATE.format(escape(item.previous_document))
+                if item.previous_document else ""
+            )
+            output_file.write(_ITEM_TEMPLATE.format(
+                item_number=item.item_number,
+                hs_code=escape(item.hs_code),
+                description=escape(item.description),
+                country_of_origin=escape(item.country_of_origin),
+                gross_weight=item.gross_weight,
+                net_weight=item.net_weight,
+                statistical_unit=escape(item.statistical_unit),
+                quantity=item.quantity,
+                customs_value=item.customs_value,
+                package_type=escape(item.package_type),
+                package_count=item.package_count,
+                marks_and_numbers=escape(item.marks_and_numbers),
+                previous_document=previous_document
+            ))
+        output_file.write("  </Items>\n")
+
+        output_file.write(closing_tag + tail)
 
 
 class PipeDelimitedGenerator:
@@ -171,24 +286,9 @@ class PipeDelimitedGenerator:
             declaration.declarant_signature or ""
         ])
         
-        # Write item rows
-        for item in declaration.items:
-            writer.writerow([
-                "I",  # Item indicator
-                str(item.item_number),
-                item.hs_code,
-                item.description,
-                item.country_of_origin,
-                str(item.gross_weight),
-                str(item.net_weight),
-                item.statistical_unit,
-                str(item.quantity),
-                str(item.customs_value),
-                item.package_type,
-                str(item.package_count),
-                item.marks_and_numbers,
-                item.previous_document or ""
-            ])
+        # Write item rows in one writerows call so csv's C loop pulls rows
+        # from the generator instead of re-entering Python per item
+        writer.writerows(_pipe_item_rows(declaration.items))
 
 
 class ExcelGenerator:
@@ -196,37 +296,63 @@ class ExcelGenerator:
     Generates structured Excel format for ASYCUDA data review.
     """
     
-    def generate(self, declaration: Declaration, output_file: BinaryIO) -> None:
+    # Item count above which generate() defaults to the raw-XML fast path
+    FAST_PATH_THRESHOLD = 5000
+
+    def generate(self, declaration: Declaration, output_file: BinaryIO,
+                 fast: Optional[bool] = None) -> None:
         """
         Generate Excel representation of the declaration.
-        
+
         Args:
             declaration: The Declaration object to convert
             output_file: File-like object to write Excel data to
-            
+            fast: Force the fast path on or off; by default it kicks in for
+                declarations above FAST_PATH_THRESHOLD items. The fast path
+                writes the Items sheet XML straight into the XLSX archive
+                (unstyled, no column widths), bypassing openpyxl's per-cell
+                overhead; the small sheets keep their styling either way.
+
         Returns:
             None
         """
         try:
-            import pandas as pd
             from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, Alignment, PatternFill
-            from openpyxl.utils.dataframe import dataframe_to_rows
+            from openpyxl.utils import get_column_letter
         except ImportError:
-            raise FormatGeneratorError("pandas and openpyxl are required for Excel generation")
-        
-        # Create workbook and sheets
-        wb = Workbook()
-        
+            raise FormatGeneratorError("openpyxl is required for Excel generation")
+
+        # Create workbook in write-only mode: rows stream straight into the
+        # XLSX archive instead of keeping every cell hydrated in memory
+        wb = Workbook(write_only=True)
+
+        title_font = Font(bold=True, size=14)
+        bold_font = Font(bold=True)
+        header_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+
+        def set_column_widths(sheet, rows):
+            """Set column widths from the row data (before rows are appended)."""
+            widths = []
+            for row in rows:
+                if len(row) > len(widths):
+                    widths.extend([0] * (len(row) - len(widths)))
+                for col_idx, value in enumerate(row):
+                    if value is None or value == "":
+                        continue
+                    # Strings dominate these sheets; measure them directly and
+                    # only stringify the numeric cells
+                    length = len(value) if isinstance(value, str) else len(str(value))
+                    if length > widths[col_idx]:
+                        widths[col_idx] = length
+            for col_idx, width in enumerate(widths, start=1):
+                if width:
+                    sheet.column_dimensions[get_column_letter(col_idx)].width = (width + 2) * 1.2
+
         # Create declaration sheet
-        declaration_sheet = wb.active
-        declaration_sheet.title = "Declaration"
-        
-        # Add header information
-        declaration_sheet['A1'] = "ASYCUDA Export Declaration"
-        declaration_sheet['A1'].font = Font(bold=True, size=14)
-        declaration_sheet.merge_cells('A1:D1')
-        
+        declaration_sheet = wb.create_sheet(title="Declaration")
+
         # Add declaration details
         declaration_data = [
             ["Registration Number", declaration.registration_number],
@@ -256,64 +382,64 @@ class ExcelGenerator:
             ["Delivery Terms", declaration.delivery_terms or ""],
             ["Warehouse Identification", declaration.warehouse_identification or ""]
         ]
-        
-        for row_idx, (label, value) in enumerate(declaration_data, start=3):
-            declaration_sheet[f'A{row_idx}'] = label
-            declaration_sheet[f'B{row_idx}'] = value
+
+        set_column_widths(declaration_sheet, declaration_data)
+
+        title_cell = WriteOnlyCell(declaration_sheet, value="ASYCUDA Export Declaration")
+        title_cell.font = title_font
+        declaration_sheet.append([title_cell])
+        declaration_sheet.append([])
+
+        for label, value in declaration_data:
             if label:
-                declaration_sheet[f'A{row_idx}'].font = Font(bold=True)
-        
+                label_cell = WriteOnlyCell(declaration_sheet, value=label)
+                label_cell.font = bold_font
+                declaration_sheet.append([label_cell, value])
+            else:
+                declaration_sheet.append([])
+
         # Create items sheet
         items_sheet = wb.create_sheet(title="Items")
-        
-        # Create DataFrame for items
-        items_data = []
-        for item in declaration.items:
-            items_data.append({
-                "Item #": item.item_number,
-                "HS Code": item.hs_code,
-                "Description": item.description,
-                "Origin": item.country_of_origin,
-                "Gross Weight": item.gross_weight,
-                "Net Weight": item.net_weight,
-                "Unit": item.statistical_unit,
-                "Quantity": item.quantity,
-                "Value": item.customs_value,
-                "Package Type": item.package_type,
-                "Packages": item.package_count,
-                "Marks": item.marks_and_numbers,
-                "Previous Doc": item.previous_document or ""
-            })
-        
-        if items_data:
-            df = pd.DataFrame(items_data)
-            
-            # Add header row
-            items_sheet['A1'] = "Declaration Items"
-            items_sheet['A1'].font = Font(bold=True, size=14)
-            items_sheet.merge_cells('A1:F1')
-            
-            # Add DataFrame rows starting at row 3
-            for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), start=3):
-                for c_idx, value in enumerate(row, start=1):
-                    items_sheet.cell(row=r_idx, column=c_idx, value=value)
-                    if r_idx == 3:  # Header row
-                        items_sheet.cell(row=r_idx, column=c_idx).font = Font(bold=True)
-                        items_sheet.cell(row=r_idx, column=c_idx).fill = PatternFill(
-                            start_color="DDDDDD", end_color="DDDDDD", fill_type="solid"
-                        )
-        
+
+        # Build item rows directly from the declaration; nothing here needs a
+        # DataFrame in between
+        item_rows = [
+            (item.item_number, item.hs_code, item.description,
+             item.country_of_origin, item.gross_weight, item.net_weight,
+             item.statistical_unit, item.quantity, item.customs_value,
+             item.package_type, item.package_count, item.marks_and_numbers,
+             item.previous_document or "")
+            for item in declaration.items
+        ]
+
+        if fast is None:
+            fast = len(item_rows) > self.FAST_PATH_THRESHOLD
+
+        if item_rows and not fast:
+            set_column_widths(items_sheet, [ITEM_HEADERS] + item_rows)
+
+            title_cell = WriteOnlyCell(items_sheet, value="Declaration Items")
+            title_cell.font = title_font
+            items_sheet.append([title_cell])
+            items_sheet.append([])
+
+            header_cells = []
+            for value in ITEM_HEADERS:
+                header_cell = WriteOnlyCell(items_sheet, value=value)
+                header_cell.font = bold_font
+                header_cell.fill = header_fill
+                header_cells.append(header_cell)
+            items_sheet.append(header_cells)
+
+            for row in item_rows:
+                items_sheet.append(row)
+
         # Create summary sheet
         summary_sheet = wb.create_sheet(title="Summary")
-        
+
         # Calculate totals
         totals = declaration.calculate_totals()
-        
-        # Add summary data
-        summary_sheet['A1'] = "Declaration Summary"
-        summary_sheet['A1'].font = Font(bold=True, size=14)
-        summary_sheet.merge_cells('A1:C1')
-        
+
         summary_data = [
             ["Total Items", str(totals['total_items'])],
             ["Total Packages", str(totals['total_packages'])],
@@ -321,25 +447,64 @@ class ExcelGenerator:
             ["Total Net Weight", f"{totals['total_net_weight']:.2f} kg"],
             ["Total Value", f"{totals['total_value']:.2f} {declaration.currency_code}"]
         ]
-        
-        for row_idx, (label, value) in enumerate(summary_data, start=3):
-            summary_sheet[f'A{row_idx}'] = label
-            summary_sheet[f'B{row_idx}'] = value
-            summary_sheet[f'A{row_idx}'].font = Font(bold=True)
-        
-        # Auto-adjust column widths
-        for sheet in wb.worksheets:
-            for column in sheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                adjusted_width = (max_length + 2) * 1.2
-                sheet.column_dimensions[column_letter].width = adjusted_width
-        
+
+        set_column_widths(summary_sheet, summary_data)
+
+        title_cell = WriteOnlyCell(summary_sheet, value="Declaration Summary")
+        title_cell.font = title_font
+        summary_sheet.append([title_cell])
+        summary_sheet.append([])
+
+        for label, value in summary_data:
+            label_cell = WriteOnlyCell(summary_sheet, value=label)
+            label_cell.font = bold_font
+            summary_sheet.append([label_cell, value])
+
         # Save workbook
-        wb.save(output_file)
+        if fast and item_rows:
+            # Save to a buffer, then rebuild the archive with the Items sheet
+            # replaced by directly assembled XML
+            buffer = io.BytesIO()
+            wb.save(buffer)
+            buffer.seek(0)
+            sheet_path = f"xl/worksheets/sheet{wb.worksheets.index(items_sheet) + 1}.xml"
+            self._replace_sheet_xml(buffer, output_file, sheet_path, item_rows)
+        else:
+            wb.save(output_file)
+
+    @staticmethod
+    def _items_sheet_xml(item_rows):
+        """Yield worksheet XML chunks for an unstyled Items sheet."""
+        yield (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            '<sheetData>'
+        )
+
+        # Inline strings keep the write single-pass: no shared-strings table
+        # to accumulate and emit at the end
+        yield '<row>' + _fmt_str_cell("Declaration Items") + '</row><row/>'
+        yield '<row>' + ''.join(_fmt_str_cell(value) for value in ITEM_HEADERS) + '</row>'
+        formatters = ITEM_COLUMN_FORMATTERS
+        for row in item_rows:
+            yield '<row>' + ''.join(
+                formatter(value) for formatter, value in zip(formatters, row)
+            ) + '</row>'
+        yield '</sheetData></worksheet>'
+
+    @classmethod
+    def _replace_sheet_xml(cls, source_buffer, output_file, sheet_path, item_rows):
+        """Copy the saved workbook archive, swapping in hand-written sheet XML."""
+        with zipfile.ZipFile(source_buffer, 'r') as src, \
+                zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as dst:
+            for info in src.infolist():
+                if info.filename != sheet_path:
+                    dst.writestr(info, src.read(info.filename))
+            sheet_info = zipfile.ZipInfo(sheet_path)
+            sheet_info.compress_type = zipfile.ZIP_DEFLATED
+            with dst.open(sheet_info, 'w', force_zip64=True) as sheet_file:
+                for chunk in cls._items_sheet_xml(item_rows):
+                    sheet_file.write(chunk.encode('utf-8'))
 
 
 class PDFGenerator:
@@ -361,6 +526,9 @@ class PDFGenerator:
         try:
             from reportlab.lib import colors
             from reportlab.lib.pagesizes import letter
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+            # LongTable lays out page by page instead of solving the whole
+            # table at once, so item tables use it with PDF_ITEM_COL_WIDTHS
+            # and repeatRows=1 to keep headers while capping peak memory
+            from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer
             from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyl
 (Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
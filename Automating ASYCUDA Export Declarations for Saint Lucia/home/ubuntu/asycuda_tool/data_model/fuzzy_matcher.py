@@ -7,9 +7,30 @@ from sales reports to the appropriate HS codes using fuzzy matching algorithms.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
-from fuzzywuzzy import fuzz, process
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+try:
+    # rapidfuzz provides C++ implementations of the fuzzywuzzy scorers,
+    # typically 10-50x faster on the per-row classification loop
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    from fuzzywuzzy import fuzz, process
+    default_process = None
+    RAPIDFUZZ_AVAILABLE = False
+try:
+    # pyahocorasick scans all keywords in one C-level pass
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+from collections import Counter
+from dataclasses import dataclass
+import concurrent.futures
+import os
 import re
+import sys
 import difflib
 import logging
 
@@ -17,18 +38,87 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Category keywords for the default HS code fallback, compiled into one
+# alternation; each group maps positionally onto _DEFAULT_HS_CODES
+_DEFAULT_HS_RE = re.compile(
+    r'(SHIRT|BLOUSE|TOP|TUNIC)|(PANT|SHORT|TROUSER)|(HAT|CAP|VISOR)|'
+    r'(BAG|PURSE|CLUTCH|CROSSBODY)|(SANDAL|SHOE|FOOTWEAR)|'
+    r'(BRACELET|NECKLACE|EARRING|RING|JEWELRY)|(SWIMSUIT|BIKINI|SWIM)'
+)
+# Tokenizer shared by token matching and reference indexing; common words
+# that carry no matching signal are dropped from both sides
+_TOKEN_RE = re.compile(r'\b\w+\b')
+_STOP_WORDS = frozenset(('AND', 'WITH', 'THE', 'OF', 'IN', 'FOR', 'TO', 'A', 'AN'))
+
+_DEFAULT_HS_CODES = (
+    '62053000',  # Shirts
+    '62034990',  # Pants
+    '65040000',  # Hats
+    '42022900',  # Bags
+    '64052000',  # Footwear
+    '71179000',  # Jewelry
+    '62111200',  # Swimwear
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HSDetails:
+    """
+    Reference details recorded for one HS code.
+
+    A slotted record instead of a per-code dict: the reference catalog holds
+    one of these per HS code, so dropping the per-entry __dict__ roughly
+    halves the memory of hs_to_details and makes field access an offset load.
+    """
+    description: str
+    hs_code: str
+    origin: str
+    office: str
+    product_code: str
+    c_nbr: str
+    line: str
+
 
 class FuzzyMatcher:
     """
     Provides fuzzy matching functionality for product descriptions.
     """
-    
+
+    __slots__ = (
+        'reference_data', 'description_to_hs', 'hs_to_details',
+        'keyword_mappings', '_sorted_keywords', '_bigram_keys', '_bigram_index', '_choices',
+        '_choices_processed', '_keyword_automaton', '_ref_token_sets',
+        '_token_postings', '_token_ref_hs', '_match_cache', '_default_result'
+    )
+
+    # Maximum number of memoized get_best_match results
+    _MATCH_CACHE_SIZE = 8192
+
     def __init__(self):
         """Initialize the fuzzy matcher."""
         self.reference_data = {}
         self.description_to_hs = {}
         self.hs_to_details = {}
         self.keyword_mappings = {}
+        self._sorted_keywords = []
+        self._bigram_keys = []
+        self._bigram_index = {}
+        self._choices = []
+        self._choices_processed = []
+        self._keyword_automaton = None
+        self._ref_token_sets = {}
+        self._token_postings = {}
+        self._token_ref_hs = []
+        self._match_cache = {}
+        # Default result shared across calls; copied on return so callers
+        # may mutate what they get back. A plain dict (not a mappingproxy)
+        # keeps instances picklable for batch_best_match's process pool.
+        self._default_result = {
+            'hs_code': '71179000',  # Default to jewelry category
+            'method': 'default',
+            'confidence': 0,
+            'details': {}
+        }
         
     def load_reference_data(self, anse_chastanet_df: pd.DataFrame):
         """
@@ -38,53 +128,110 @@ class FuzzyMatcher:
             anse_chastanet_df: DataFrame containing reference data
         """
         logger.info(f"Loading reference data with {len(anse_chastanet_df)} rows")
-        
-        # Process each row in the reference data
-        for _, row in anse_chastanet_df.iterrows():
-            try:
-                # Extract key fields
-                description = str(row.get('Description', '')).strip().upper()
-                hs_code = str(row.get('HS Code', '')).strip().replace('000000', '')
-                origin = str(row.get('Origin', 'US')).strip()
-                office = str(row.get('Office', '')).strip()
-                product_code = str(row.get('Product', '')).strip()
-                c_nbr = str(row.get('C Nbr', '')).strip()
-                line = str(row.get('Line', '')).strip()
-                
-                if not description or not hs_code:
-                    continue
-                
-                # Store in lookup dictionaries
-                self.description_to_hs[description] = hs_code
-                
-                # Store details for this HS code
-                details = {
-                    'description': description,
-                    'hs_code': hs_code,
-                    'origin': origin,
-                    'office': office,
-                    'product_code': product_code,
-                    'c_nbr': c_nbr,
-                    'line': line
-                }
-                
-                self.hs_to_details[hs_code] = details
-                
-                # Also add product code as a key if available
-                if product_code:
-                    self.description_to_hs[product_code.upper()] = hs_code
-                
-            except Exception as e:
-                logger.error(f"Error processing reference data row: {e}")
-        
+
+        # New reference data invalidates previously memoized matches
+        self._match_cache.clear()
+
+        df = anse_chastanet_df
+
+        def column(name, missing=''):
+            """Extract a cleaned string column, tolerating absent columns."""
+            if name in df.columns:
+                return df[name].fillna('').astype(str).str.strip()
+            return pd.Series(missing, index=df.index)
+
+        # Extract key fields column-wise instead of boxing a Series per row
+        descriptions = column('Description').str.upper()
+        # Intern the HS codes: the catalog maps many descriptions onto a
+        # small universe of codes, so sharing one str object per code
+        # saves memory and makes later dict lookups cheaper
+        hs_codes = column('HS Code').str.replace('000000', '', regex=False)
+        origins = column('Origin', missing='US')
+        offices = column('Office')
+        product_codes = column('Product')
+        c_nbrs = column('C Nbr')
+        lines = column('Line')
+
+        mask = (descriptions != '') & (hs_codes != '')
+
+        kept_descriptions = descriptions[mask].tolist()
+        kept_hs_codes = [sys.intern(code) for code in hs_codes[mask].tolist()]
+
+        # Store in lookup dictionaries with bulk updates
+        self.description_to_hs.update(zip(kept_descriptions, kept_hs_codes))
+
+        # Store details for each HS code (last row per code wins, as before);
+        # origins repeat heavily across the catalog, so intern them too
+        self.hs_to_details.update({
+            hs_code: HSDetails(
+                description=description,
+                hs_code=hs_code,
+                origin=sys.intern(origin),
+                office=office,
+                product_code=product_code,
+                c_nbr=c_nbr,
+                line=line
+            )
+            for description, hs_code, origin, office, product_code, c_nbr, line in zip(
+                kept_descriptions, kept_hs_codes, origins[mask].tolist(),
+                offices[mask].tolist(), product_codes[mask].tolist(),
+                c_nbrs[mask].tolist(), lines[mask].tolist()
+            )
+        })
+
+        # Also add product codes as alternate lookup keys where available
+        product_mask = mask & (product_codes != '')
+        self.description_to_hs.update(
+            zip(product_codes[product_mask].str.upper().tolist(),
+                (sys.intern(code) for code in hs_codes[product_mask].tolist()))
+        )
+
+        skipped = int((~mask).sum())
+        if skipped:
+            logger.info(f"Skipped {skipped} rows without HS code or description")
         logger.info(f"Loaded {len(self.description_to_hs)} descriptions and {len(self.hs_to_details)} HS codes")
-        
+
+        # Build the bigram index used to prefilter fallback fuzzy matching
+        self._build_bigram_index()
+
+        # Precompute the candidate list (and its preprocessed form for
+        # rapidfuzz) once instead of per query
+        self._choices = list(self.description_to_hs.keys())
+        if RAPIDFUZZ_AVAILABLE:
+            self._choices_processed = [default_process(choice) for choice in self._choices]
+
+        # Tokenize the reference descriptions once; the reference side never
+        # changes between token_match queries. Bind the findall method into a
+        # local so the comprehension skips the module-attribute lookups.
+        find_tokens = _TOKEN_RE.findall
+        self._ref_token_sets = {
+            ref_desc: frozenset(find_tokens(ref_desc)).difference(_STOP_WORDS)
+            for ref_desc in self.description_to_hs
+        }
+
+        # Inverted index from token to reference indices, so token_match only
+        # visits references that share at least one token with the query
+        self._token_postings = {}
+        self._token_ref_hs = []
+        for ref_idx, (ref_desc, ref_tokens) in enumerate(self._ref_token_sets.items()):
+            self._token_ref_hs.append(self.description_to_hs[ref_desc])
+            for token in ref_tokens:
+                self._token_postings.setdefault(token, []).append(ref_idx)
+
         # Initialize keyword mappings
         self._initialize_keyword_mappings()
+
+    def _build_bigram_index(self):
+        """Build an inverted index from character bigrams to reference keys."""
+        self._bigram_keys = list(self.description_to_hs.keys())
+        self._bigram_index = {}
+        for idx, key in enumerate(self._bigram_keys):
+            for bigram in {key[i:i + 2] for i in range(len(key) - 1)}:
+                self._bigram_index.setdefault(bigram, []).append(idx)
     
     def _initialize_keyword_mappings(self):
         """Initialize keyword to HS code mappings for common product categories."""
-        self.keyword_mappings = {
+        keyword_mappings = {
             'HAT': '65040000',
             'CAP': '65040000',
             'VISOR': '65040000',
@@ -115,6 +262,23 @@ class FuzzyMatcher:
             'BOTTOM': '62089290',
             'RASHGUARD': '62111200'
         }
+        # Share the same str objects as the reference-data codes
+        self.keyword_mappings = {k: sys.intern(v) for k, v in keyword_mappings.items()}
+
+        # Longest keyword first, so 'COSMETIC BAG' wins over 'BAG' and the
+        # fallback scan can stop at the first (most specific) hit
+        self._sorted_keywords = sorted(
+            self.keyword_mappings.items(), key=lambda kv: -len(kv[0])
+        )
+
+        # Compile the keywords into an Aho-Corasick automaton so keyword_match
+        # scans the description once instead of per keyword
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword, hs_code in self.keyword_mappings.items():
+                automaton.add_word(keyword, (keyword, hs_code))
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
     
     def exact_match(self, description: str) -> Optional[str]:
         """
@@ -128,49 +292,95 @@ class FuzzyMatcher:
         """
         if not description:
             return None
-            
-        description = description.strip().upper()
+
+        return self._exact_match(description.strip().upper())
+
+    def _exact_match(self, description: str) -> Optional[str]:
+        """Exact lookup for an already stripped, upper-cased description."""
         return self.description_to_hs.get(description)
-    
+
     def keyword_match(self, description: str) -> Optional[str]:
         """
         Find match based on keywords in the description.
-        
+
         Args:
             description: Product description to match
-            
+
         Returns:
             HS code if found, None otherwise
         """
         if not description:
             return None
-            
-        description = description.strip().upper()
-        
-        # Check for exact keywords in the description
-        for keyword, hs_code in self.keyword_mappings.items():
+
+        return self._keyword_match(description.strip().upper())
+
+    def _keyword_match(self, description: str) -> Optional[str]:
+        """Keyword scan over an already stripped, upper-cased description."""
+        if self._keyword_automaton is not None:
+            # Single automaton pass over the description; keep the longest
+            # keyword so the most specific category wins
+            best_keyword = None
+            best_hs_code = None
+            for _, (keyword, hs_code) in self._keyword_automaton.iter(description):
+                if best_keyword is None or len(keyword) > len(best_keyword):
+                    best_keyword = keyword
+                    best_hs_code = hs_code
+            if best_keyword is not None:
+                logger.debug(f"Keyword match found: '{best_keyword}' in '{description}' -> {best_hs_code}")
+                return best_hs_code
+            return None
+
+        # Check keywords longest-first; the first hit is the most specific
+        for keyword, hs_code in self._sorted_keywords:
             if keyword in description:
                 logger.debug(f"Keyword match found: '{keyword}' in '{description}' -> {hs_code}")
                 return hs_code
-        
+
         return None
     
-    def fuzzy_match(self, description: str, threshold: int = 80) -> Optional[Tuple[str, int]]:
+    def fuzzy_match(self, description: str, threshold: int = 80) -> Optional[Dict[str, Any]]:
         """
         Find fuzzy match for a product description.
-        
+
         Args:
             description: Product description to match
             threshold: Minimum similarity score (0-100) to consider a match
-            
+
         Returns:
-            Tuple of (HS code, score) if found, None otherwise
+            Match result dictionary (hs_code, method, confidence, details) if found,
+            None otherwise
         """
         if not description or not self.description_to_hs:
             return None
-            
-        description = description.strip().upper()
-        
+
+        return self._fuzzy_match(description.strip().upper(), threshold)
+
+    def _fuzzy_match(self, description: str, threshold: int) -> Optional[Dict[str, Any]]:
+        """Fuzzy match an already stripped, upper-cased description."""
+        # Pre-bind the details lookup so the hot path uses a local instead of
+        # repeated attribute/method resolution
+        details_get = self.hs_to_details.get
+
+        if RAPIDFUZZ_AVAILABLE:
+            match = process.extractOne(
+                default_process(description),
+                self._choices_processed,
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=threshold
+            )
+            if match is not None:
+                _, score, match_idx = match
+                matched_key = self._choices[match_idx]
+                hs_code = self.description_to_hs[matched_key]
+                logger.debug(f"Fuzzy match found: '{description}' -> '{matched_key}' (score: {score}) -> {hs_code}")
+                return {
+                    'hs_code': hs_code,
+                    'method': 'fuzzy',
+                    'confidence': score,
+                    'details': details_get(hs_code, {})
+                }
+            return None
+
         try:
             # Use fuzzywuzzy for fuzzy matching
             match, score = process.extractOne(
@@ -178,31 +388,54 @@ class FuzzyMatcher:
                 self.description_to_hs.keys(),
                 scorer=fuzz.token_sort_ratio
             )
-            
+
             if score >= threshold:
                 hs_code = self.description_to_hs[match]
                 logger.debug(f"Fuzzy match found: '{description}' -> '{match}' (score: {score}) -> {hs_code}")
-                return (hs_code, score)
-                
+                return {
+                    'hs_code': hs_code,
+                    'method': 'fuzzy',
+                    'confidence': score,
+                    'details': details_get(hs_code, {})
+                }
+
         except Exception as e:
             logger.warning(f"Error in fuzzy matching: {e}")
-            
-            # Fall back to simpler matching if fuzzywuzzy fails
+
+            # Fall back to simpler matching if fuzzywuzzy fails. SequenceMatcher
+            # is quadratic per comparison, so prefilter with the bigram index:
+            # only keys sharing enough bigrams with the query get rescored.
+            candidates = self._bigram_keys
+            query_bigrams = {description[i:i + 2] for i in range(len(description) - 1)}
+            if query_bigrams and self._bigram_index:
+                overlap_counts = Counter()
+                for bigram in query_bigrams:
+                    overlap_counts.update(self._bigram_index.get(bigram, ()))
+                min_overlap = max(1, int(threshold / 100 * len(query_bigrams)))
+                candidates = [self._bigram_keys[idx]
+                              for idx, count in overlap_counts.items()
+                              if count >= min_overlap]
+
             best_score = 0
             best_match = None
-            
-            for ref_desc in self.description_to_hs.keys():
+
+            for ref_desc in candidates:
                 # Use difflib for basic fuzzy matching
                 score = difflib.SequenceMatcher(None, description, ref_desc).ratio() * 100
                 if score > best_score and score >= threshold:
                     best_score = score
                     best_match = ref_desc
-            
+
             if best_match:
                 hs_code = self.description_to_hs[best_match]
                 logger.debug(f"Fallback fuzzy match found: '{description}' -> '{best_match}' (score: {best_score}) -> {hs_code}")
-                return (hs_code, best_score)
-        
+                return {
+                    'hs_code': hs_code,
+                    'method': 'fuzzy',
+                    'confidence': best_score,
+                    'details': details_get(hs_code, {})
+                }
+
         return None
     
     def token_match(self, description: str, threshold: int = 2) -> Optional[str]:
@@ -218,99 +451,122 @@ class FuzzyMatcher:
         """
         if not description or not self.description_to_hs:
             return None
-            
-        description = description.strip().upper()
-        
-        # Tokenize the description
-        tokens = set(re.findall(r'\b\w+\b', description))
-        
-        # Remove common words that don't help with matching
-        stop_words = {'AND', 'WITH', 'THE', 'OF', 'IN', 'FOR', 'TO', 'A', 'AN'}
-        tokens = tokens - stop_words
-        
+
+        return self._token_match(description.strip().upper(), threshold)
+
+    def _token_match(self, description: str, threshold: int) -> Optional[str]:
+        """Token-overlap match for an already stripped, upper-cased description."""
+        # Tokenize the description and drop the shared stop words
+        tokens = set(_TOKEN_RE.findall(description)).difference(_STOP_WORDS)
+
+
         best_match = None
         best_count = 0
-        
-        # Find reference description with most token overlap
-        for ref_desc, hs_code in self.description_to_hs.items():
-            ref_tokens = set(re.findall(r'\b\w+\b', ref_desc))
-            ref_tokens = ref_tokens - stop_words
-            
-            # Count matching tokens
-            common_tokens = tokens.intersection(ref_tokens)
-            if len(common_tokens) > best_count and len(common_tokens) >= threshold:
-                best_count = len(common_tokens)
-                best_match = hs_code
-        
+
+        # Count token overlap via the inverted index: only references sharing
+        # at least one query token are touched.
+        postings_get = self._token_postings.get
+        overlap_counts = Counter()
+        for token in tokens:
+            postings = postings_get(token)
+            if postings is not None:
+                overlap_counts.update(postings)
+
+        if overlap_counts:
+            best_ref_idx, best_count = overlap_counts.most_common(1)[0]
+            if best_count >= threshold:
+                best_match = self._token_ref_hs[best_ref_idx]
+
         if best_match:
             logger.debug(f"Token match found: '{description}' -> {best_match} (common tokens: {best_count})")
-            
+
         return best_match
     
     def get_best_match(self, description: str) -> Dict[str, Any]:
         """
         Get the best HS code match for a product description using multiple methods.
-        
+
+        Results are memoized per normalized description: sales reports repeat
+        the same products across many line items, so repeated calls become a
+        dict lookup.
+
         Args:
             description: Product description to match
-            
+
         Returns:
             Dictionary with match details including HS code, method, and confidence
         """
         if not description:
+            return dict(self._default_result)
+
+        # Normalize once; every matcher below expects the stripped,
+        # upper-cased form, so the per-method re-normalization is skipped
+        normalized = description.strip().upper()
+
+        cached = self._match_cache.get(normalized)
+        if cached is None:
+            if len(self._match_cache) >= self._MATCH_CACHE_SIZE:
+                self._match_cache.clear()
+            cached = self._match_cache[normalized] = self._best_match_uncached(normalized)
+
+        # Copy so callers cannot mutate the cached payload
+        return dict(cached)
+
+    def _best_match_uncached(self, description: str) -> Dict[str, Any]:
+        """Run the full match cascade for a normalized, non-empty description."""
+        logger.info(f"Finding best match for: '{description}'")
+
+        # Without reference data every matcher below would miss, so jump
+        # straight to the category-keyword fallback
+        if not self.description_to_hs:
             return {
-                'hs_code': '71179000',  # Default to jewelry category
+                'hs_code': self._get_default_hs_code(description),
                 'method': 'default',
-                'confidence': 0,
+                'confidence': 30,
                 'details': {}
             }
-        
-        description = description.strip()
-        logger.info(f"Finding best match for: '{description}'")
-        
+
+        # Pre-bind the details lookup used by each match branch
+        details_get = self.hs_to_details.get
+
         # Try exact match first (highest confidence)
-        exact = self.exact_match(description)
+        exact = self._exact_match(description)
         if exact:
             logger.info(f"Exact match found: {exact}")
             return {
                 'hs_code': exact,
                 'method': 'exact',
                 'confidence': 100,
-                'details': self.hs_to_details.get(exact, {})
+                'details': details_get(exact, {})
             }
-        
+
         # Try keyword match (high confidence)
-        keyword = self.keyword_match(description)
+        keyword = self._keyword_match(description)
         if keyword:
             logger.info(f"Keyword match found: {keyword}")
             return {
                 'hs_code': keyword,
                 'method': 'keyword',
                 'confidence': 90,
-                'details': self.hs_to_details.get(keyword, {})
+                'details': details_get(keyword, {})
             }
-        
-        # Try fuzzy match (medium confidence)
-        fuzzy = self.fuzzy_match(description)
+
+        # Try fuzzy match (medium confidence); the result is already in the
+        # final shape, so pass it through without unpacking
+        fuzzy = self._fuzzy_match(description, threshold=80)
         if fuzzy:
-            hs_code, score = fuzzy
-            logger.info(f"Fuzzy match found: {hs_code} (score: {score})")
-            return {
-                'hs_code': hs_code,
-                'method': 'fuzzy',
-                'confidence': score,
-                'details': self.hs_to_details.get(hs_code, {})
-            }
-        
+            logger.info(f"Fuzzy match found: {fuzzy['hs_code']} (score: {fuzzy['confidence']})")
+            return fuzzy
+
         # Try token match (lower confidence)
-        token = self.token_match(description)
+        token = self._token_match(description, threshold=2)
         if token:
             logger.info(f"Token match found: {token}")
             return {
                 'hs_code': token,
                 'method': 'token',
                 'confidence': 60,
-                'details': self.hs_to_details.get(token, {})
+                'details': details_get(token, {})
             }
         
         # Default fallback based on product category keywords
@@ -323,6 +579,135 @@ class FuzzyMatcher:
             'details': {}
         }
     
+    def get_best_matches(self, descriptions: Sequence[str], threshold: int = 80) -> List[Dict[str, Any]]:
+        """
+        Get best HS code matches for many descriptions in one batched pass.
+
+        The match cascade still runs per description, but the fuzzy stage is
+        scored up front for the whole batch with a single rapidfuzz cdist
+        call, which computes the full query x reference score matrix in
+        parallel C code instead of one extractOne call per query.
+
+        Args:
+            descriptions: Product descriptions to match
+            threshold: Minimum similarity score (0-100) for a fuzzy match
+
+        Returns:
+            List of match result dictionaries, in the same order as the input
+        """
+        descriptions = list(descriptions)
+
+        if not RAPIDFUZZ_AVAILABLE or not self._choices:
+            return [self.get_best_match(description) for description in descriptions]
+
+        normalized = [description.strip().upper() if description else ''
+                      for description in descriptions]
+
+        # Score every query against every reference at once
+        queries = [default_process(query) for query in normalized]
+        scores = process.cdist(
+            queries,
+            self._choices_processed,
+            scorer=fuzz.token_sort_ratio,
+            dtype=np.uint8,
+            workers=-1
+        )
+        best_indices = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(queries)), best_indices]
+
+        details_get = self.hs_to_details.get
+        results = []
+        for query, best_idx, best_score in zip(normalized, best_indices, best_scores):
+            if not query:
+                results.append(dict(self._default_result))
+                continue
+
+            cached = self._match_cache.get(query)
+            if cached is not None:
+                results.append(dict(cached))
+                continue
+
+            result = None
+            exact = self._exact_match(query)
+            if exact:
+                result = {
+                    'hs_code': exact,
+                    'method': 'exact',
+                    'confidence': 100,
+                    'details': details_get(exact, {})
+                }
+            if result is None:
+                keyword = self._keyword_match(query)
+                if keyword:
+                    result = {
+                        'hs_code': keyword,
+                        'method': 'keyword',
+                        'confidence': 90,
+                        'details': details_get(keyword, {})
+                    }
+            if result is None and best_score >= threshold:
+                hs_code = self.description_to_hs[self._choices[best_idx]]
+                result = {
+                    'hs_code': hs_code,
+                    'method': 'fuzzy',
+                    'confidence': int(best_score),
+                    'details': details_get(hs_code, {})
+                }
+            if result is None:
+                token = self._token_match(query, threshold=2)
+                if token:
+                    result = {
+                        'hs_code': token,
+                        'method': 'token',
+                        'confidence': 60,
+                        'details': details_get(token, {})
+                    }
+            if result is None:
+                result = {
+                    'hs_code': self._get_default_hs_code(query),
+                    'method': 'default',
+                    'confidence': 30,
+                    'details': {}
+                }
+
+            if len(self._match_cache) >= self._MATCH_CACHE_SIZE:
+                self._match_cache.clear()
+            self._match_cache[query] = result
+            results.append(dict(result))
+
+        return results
+
+    def batch_best_match(self, descriptions: Sequence[str], workers: int = -1) -> List[Dict[str, Any]]:
+        """
+        Get best HS code matches for a batch of product descriptions.
+
+        Each description is classified independently, so large batches are
+        farmed out to a process pool. Small batches stay on the serial path
+        where pool start-up cost would dominate.
+
+        Args:
+            descriptions: Product descriptions to match
+            workers: Number of worker processes (-1 uses all available cores)
+
+        Returns:
+            List of match result dictionaries, in the same order as the input
+        """
+        descriptions = list(descriptions)
+
+        if workers == -1:
+            workers = os.cpu_count() or 1
+
+        # Serial path for small batches or single-worker requests; the
+        # batched scorer still parallelizes the fuzzy stage internally
+        if workers <= 1 or len(descriptions) < 100:
+            return self.get_best_matches(descriptions)
+
+        logger.info(f"Classifying {len(descriptions)} descriptions with {workers} workers")
+
+        chunksize = max(1, len(descriptions) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_best_match, descriptions, chunksize=chunksize))
+
     def _get_default_hs_code(self, description: str) -> str:
         """
         Get a default HS code based on product category keywords.
@@ -333,23 +718,10 @@ class FuzzyMatcher:
         Returns:
             Default HS code
         """
-        description = description.upper()
-        
-        # Check for category keywords
-        if any(word in description for word in ['SHIRT', 'BLOUSE', 'TOP', 'TUNIC']):
-            return '62053000'  # Shirts
-        elif any(word in description for word in ['PANT', 'SHORT', 'TROUSER']):
-            return '62034990'  # Pants
-        elif any(word in description for word in ['HAT', 'CAP', 'VISOR']):
-            return '65040000'  # Hats
-        elif any(word in description for word in ['BAG', 'PURSE', 'CLUTCH', 'CROSSBODY']):
-            return '42022900'  # Bags
-        elif any(word in description for word in ['SANDAL', 'SHOE', 'FOOTWEAR']):
-            return '64052000'  # Footwear
-        elif any(word in description for word in ['BRACELET', 'NECKLACE', 'EARRING', 'RING', 'JEWELRY']):
-            return '71179000'  # Jewelry
-        elif any(word in description for word in ['SWIMSUIT', 'BIKINI', 'SWIM']):
-            return '62111200'  # Swimwear
-        
+        # Check for category keywords with a single alternation pass
+        match = _DEFAULT_HS_RE.search(description.upper())
+        if match:
+            return _DEFAULT_HS_CODES[match.lastindex - 1]
+
         # Default to jewelry as a safe fallback
         return '71179000'
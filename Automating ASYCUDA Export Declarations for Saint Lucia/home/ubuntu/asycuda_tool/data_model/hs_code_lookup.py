@@ -8,16 +8,57 @@ manage a reference database of HS codes, and validate HS code assignments.
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
+import functools
 import re
 import logging
 import os
+import sys
 import json
+import time
+from datetime import datetime
 from .fuzzy_matcher import FuzzyMatcher
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Map HS code prefixes to common customs offices
+_OFFICE_BY_HS = {
+    '42': 'LCCAP',  # Bags
+    '62': 'LCVGC',  # Clothing
+    '64': 'LCVFP',  # Footwear
+    '65': 'LCCAP',  # Headwear
+    '71': 'LCCAP',  # Jewelry
+}
+
+# Same mapping compiled into a list indexed by the 2-digit prefix as an
+# integer, replacing dict hashing with a plain index in the lookup path
+_OFFICE_TABLE = ['LCCAP'] * 100
+for _prefix, _office in _OFFICE_BY_HS.items():
+    _OFFICE_TABLE[int(_prefix)] = _office
+del _prefix, _office
+
+@functools.lru_cache(maxsize=1)
+def _year_for_day(day: int) -> int:
+    """Resolve the current year, memoized on the day number so long-running
+    processes pick up a year change without paying datetime.now() per call."""
+    return datetime.now().year
+
+
+def _current_year() -> int:
+    return _year_for_day(int(time.time() // 86400))
+
+
+@functools.lru_cache(maxsize=256)
+def _default_ref(hs_prefix: str, year: int) -> str:
+    """Build the default previous-document reference for an HS prefix."""
+    try:
+        idx = int(hs_prefix)
+        office = _OFFICE_TABLE[idx] if 0 <= idx < 100 else 'LCCAP'
+    except ValueError:
+        office = 'LCCAP'
+    return f"{office} {year} C 10000 art. 1"
+
 
 class HSCodeLookup:
     """
@@ -35,7 +76,15 @@ class HSCodeLookup:
         self.hs_code_database = {}
         self.country_of_origin_map = {}
         self.previous_document_map = {}
-        
+
+        # Origin and previous-document lookups typically arrive back-to-back
+        # for the same description; cache the shared HS match so the second
+        # call is a plain dict hit. Bound per instance so the cache dies with
+        # the lookup object.
+        self._lookup_hs_code_cached = functools.lru_cache(maxsize=4096)(
+            self.fuzzy_matcher.get_best_match
+        )
+
         # Load reference data if provided
         if reference_data_path and os.path.exists(reference_data_path):
             self.load_reference_data(reference_data_path)
@@ -68,7 +117,10 @@ class HSCodeLookup:
             
             # Process the DataFrame
             self._process_reference_dataframe(df)
-            
+
+            # New reference data invalidates previously cached matches
+            self._lookup_hs_code_cached.cache_clear()
+
         except Exception as e:
             logger.error(f"Error loading reference data: {e}")
     
@@ -97,56 +149,84 @@ class HSCodeLookup:
         Args:
             df: DataFrame in ANSE CHASTANET STOCK format
         """
+        def column(name, missing=''):
+            """Extract a cleaned string column, tolerating absent columns."""
+            if name in df.columns:
+                return df[name].fillna('').astype(str).str.strip()
+            return pd.Series(missing, index=df.index)
+
+        # Extract all fields column-wise, then iterate plain Python lists;
+        # this avoids boxing a Series per row as iterrows does
+        hs_codes = column('HS Code').str.replace('000000', '', regex=False)
+        descriptions = column('Description')
+        origins = column('Origin', missing='US')
+        offices = column('Office')
+        product_codes = column('Product')
+        c_nbrs = column('C Nbr')
+        lines = column('Line')
+        years = column('Year')
+
+        mask = (hs_codes != '') & (descriptions != '')
+
+        rows = zip(
+            hs_codes[mask].tolist(), descriptions[mask].tolist(),
+            origins[mask].tolist(), offices[mask].tolist(),
+            product_codes[mask].tolist(), c_nbrs[mask].tolist(),
+            lines[mask].tolist(), years[mask].tolist()
+        )
+
+        # Low-cardinality columns (origin, office, year) repeat a handful of
+        # distinct values across thousands of rows; pool them so every row
+        # stores the same str object instead of a fresh copy
+        pool = {}
+        pooled = pool.setdefault
+
         # Build HS code database
-        for _, row in df.iterrows():
-            try:
-                hs_code = str(row.get('HS Code', '')).strip().replace('000000', '')
-                description = str(row.get('Description', '')).strip()
-                origin = str(row.get('Origin', 'US')).strip()
-                office = str(row.get('Office', '')).strip()
-                product_code = str(row.get('Product', '')).strip()
-                c_nbr = str(row.get('C Nbr', '')).strip()
-                line = str(row.get('Line', '')).strip()
-                year = str(row.get('Year', '')).strip()
-                
-                if not hs_code or not description:
-                    continue
-                
-                # Add to HS code database
-                if hs_code not in self.hs_code_database:
-                    self.hs_code_database[hs_code] = {
-                        'description': description,
-                        'products': []
-                    }
-                
-                # Add product details
-                product_info = {
-                    'product_code': product_code,
+        for hs_code, description, origin, office, product_code, c_nbr, line, year in rows:
+            # Interned so all products under the same code share one str object
+            hs_code = sys.intern(hs_code)
+            origin = pooled(origin, origin)
+            office = pooled(office, office)
+            year = pooled(year, year)
+
+            # Add to HS code database
+            entry = self.hs_code_database.get(hs_code)
+            if entry is None:
+                entry = {
                     'description': description,
-                    'origin': origin,
-                    'office': office,
-                    'c_nbr': c_nbr,
-                    'line': line,
-                    'year': year
+                    'products': []
                 }
-                
-                self.hs_code_database[hs_code]['products'].append(product_info)
-                
+                self.hs_code_database[hs_code] = entry
+
+            # Add product details
+            entry['products'].append({
+                'product_code': product_code,
+                'description': description,
+                'origin': origin,
+                'office': office,
+                'c_nbr': c_nbr,
+                'line': line,
+                'year': year
+            })
+
+            if product_code:
+                product_code_upper = product_code.upper()
+
                 # Add to country of origin map
-                if product_code:
-                    self.country_of_origin_map[product_code.upper()] = origin
-                
+                self.country_of_origin_map[product_code_upper] = origin
+
                 # Add to previous document map
-                if product_code and c_nbr and office and year:
+                if c_nbr and office and year:
                     document_ref = f"{office} {year} C {c_nbr}"
                     if line:
                         document_ref += f" art. {line}"
-                    
-                    self.previous_document_map[product_code.upper()] = document_ref
-                
-            except Exception as e:
-                logger.warning(f"Error processing row: {e}")
-    
+
+                    self.previous_document_map[product_code_upper] = document_ref
+
+        skipped = int((~mask).sum())
+        if skipped:
+            logger.info(f"Skipped {skipped} rows without HS code or description")
+
     def _process_generic_format(self, df: pd.DataFrame):
         """
         Process reference data in generic format.
@@ -162,39 +242,52 @@ class HSCodeLookup:
         if not hs_col or not desc_col:
             logger.warning("Could not identify required columns in reference data")
             return
-        
+
+        # Clean column-wise up front; bad cells become empty strings and are
+        # filtered by the mask instead of tripping a per-row exception handler
+        hs_codes = df[hs_col].fillna('').astype(str).str.strip()
+        descriptions = df[desc_col].fillna('').astype(str).str.strip()
+        if origin_col:
+            origins = df[origin_col].fillna('').astype(str).str.strip()
+        else:
+            origins = pd.Series('US', index=df.index)
+
+        mask = (hs_codes != '') & (descriptions != '')
+
+        # Any extra columns ride along as per-product properties
+        extra_cols = [col for col in df.columns
+                      if col not in (hs_col, desc_col, origin_col)]
+        extras = df.loc[mask, extra_cols].to_dict('records') if extra_cols else None
+
+        rows = zip(hs_codes[mask].tolist(), descriptions[mask].tolist(),
+                   origins[mask].tolist())
+
         # Build HS code database
-        for _, row in df.iterrows():
-            try:
-                hs_code = str(row[hs_col]).strip()
-                description = str(row[desc_col]).strip()
-                origin = str(row[origin_col]).strip() if origin_col else 'US'
-                
-                if not hs_code or not description:
-                    continue
-                
-                # Add to HS code database
-                if hs_code not in self.hs_code_database:
-                    self.hs_code_database[hs_code] = {
-                        'description': description,
-                        'products': []
-                    }
-                
-                # Add product details
-                product_info = {
+        for row_idx, (hs_code, description, origin) in enumerate(rows):
+            hs_code = sys.intern(hs_code)
+
+            # Add to HS code database
+            entry = self.hs_code_database.get(hs_code)
+            if entry is None:
+                entry = {
                     'description': description,
-                    'origin': origin
+                    'products': []
                 }
-                
-                # Add any additional columns as properties
-                for col in df.columns:
-                    if col not in [hs_col, desc_col, origin_col]:
-                        product_info[col] = row[col]
-                
-                self.hs_code_database[hs_code]['products'].append(product_info)
-                
-            except Exception as e:
-                logger.warning(f"Error processing row: {e}")
+                self.hs_code_database[hs_code] = entry
+
+            # Add product details
+            product_info = {
+                'description': description,
+                'origin': origin
+            }
+            if extras is not None:
+                product_info.update(extras[row_idx])
+
+            entry['products'].append(product_info)
+
+        skipped = int((~mask).sum())
+        if skipped:
+            logger.info(f"Skipped {skipped} rows without HS code or description")
     
     def lookup_hs_code(self, description: str) -> Dict[str, Any]:
         """
@@ -225,10 +318,12 @@ class HSCodeLookup:
         
         # Try lookup via HS code match
         if description:
-            match = self.lookup_hs_code(description)
-            if match and 'details' in match and 'origin' in match['details']:
-                return match['details']['origin']
-        
+            match = self._lookup_hs_code_cached(description)
+            # details is an HSDetails record (or an empty dict for defaults)
+            origin = getattr(match.get('details'), 'origin', '') if match else ''
+            if origin:
+                return origin
+
         # Default to US
         return 'US'
     
@@ -250,33 +345,23 @@ class HSCodeLookup:
         
         # Try lookup via HS code match
         if description:
-            match = self.lookup_hs_code(description)
-            if match and 'details' in match:
-                details = match['details']
-                if 'office' in details and 'year' in details and 'c_nbr' in details:
-                    document_ref = f"{details['office']} {details['year']} C {details['c_nbr']}"
-                    if 'line' in details:
-                        document_ref += f" art. {details['line']}"
-                    return document_ref
+            match = self._lookup_hs_code_cached(description)
+            details = match.get('details') if match else None
+            office = getattr(details, 'office', '')
+            year = getattr(details, 'year', '')
+            c_nbr = getattr(details, 'c_nbr', '')
+            if office and year and c_nbr:
+                document_ref = f"{office} {year} C {c_nbr}"
+                line = getattr(details, 'line', '')
+                if line:
+                    document_ref += f" art. {line}"
+                return document_ref
         
-        # Generate a default reference based on HS code
+        # Generate a plausible default reference based on HS code; cached so
+        # repeated prefixes reuse one interned string
         if hs_code:
-            # Map HS code prefixes to common customs offices
-            hs_prefix = hs_code[:2]
-            office_mapping = {
-                '42': 'LCCAP',  # Bags
-                '62': 'LCVGC',  # Clothing
-                '64': 'LCVFP',  # Footwear
-                '65': 'LCCAP',  # Headwear
-                '71': 'LCCAP',  # Jewelry
-            }
-            
-            office = office_mapping.get(hs_prefix, 'LCCAP')
-            current_year = pd.Timestamp.now().year
-            
-            # Generate a plausible document reference
-            return f"{office} {current_year} C 10000 art. 1"
-        
+            return _default_ref(hs_code[:2], _current_year())
+
         return None
     
     def validate_hs_code(self, hs_code: str) -> bool:
@@ -289,15 +374,17 @@ class HSCodeLookup:
         Returns:
             True if valid, False otherwise
         """
-        # Check format (6-10 digits)
-        if not re.match(r'^\d{6,10}$', hs_code):
+        # Check format (6-10 digits) with plain str methods; the isascii
+        # guard keeps unicode digits out, matching the old regex
+        if not hs_code or not (6 <= len(hs_code) <= 10) \
+                or not hs_code.isascii() or not hs_code.isdigit():
             return False
-        
+
         # Check if in database (optional)
         if self.hs_code_database and hs_code not in self.hs_code_database:
-            logger.warning(f"HS code {hs_code} not found in reference database")
+            logger.warning("HS code %s not found in reference database", hs_code)
             # Still return True as it might be valid even if not in our database
-        
+
         return True
     
     def get_hs_code_details(self, hs_code: str) -> Dict[str, Any]:
@@ -320,27 +407,42 @@ class HSCodeLookup:
             file_path: Path to export file (CSV, Excel, or JSON)
         """
         try:
-            # Convert database to DataFrame
-            data = []
+            # Convert database to DataFrame: one frame per HS code from its
+            # product dicts, with the code and shared description broadcast
+            # as columns, then a single concat instead of R row dicts
+            frames = []
             for hs_code, details in self.hs_code_database.items():
-                for product in details['products']:
-                    row = {'HS Code': hs_code, 'Description': details['description']}
-                    row.update(product)
-                    data.append(row)
-            
-            df = pd.DataFrame(data)
-            
+                sub = pd.DataFrame(details['products'])
+                sub.insert(0, 'Description', details['description'])
+                sub.insert(0, 'HS Code', hs_code)
+                frames.append(sub)
+
+            df = pd.concat(frames, ignore_index=True, copy=False) if frames else pd.DataFrame()
+
             # Determine file type from extension
             _, ext = os.path.splitext(file_path)
             ext = ext.lower()
-            
+
             if ext == '.csv':
-                df.to_csv(file_path, index=False)
+                # Stream in chunks instead of buffering the whole
+                # stringified frame
+                df.to_csv(file_path, index=False, chunksize=100_000)
             elif ext == '.xlsx':
-                df.to_excel(file_path, index=False)
+                # xlsxwriter in constant-memory mode writes rows as it goes
+                # rather than holding the full workbook in RAM; fall back to
+                # the default engine when it is not installed
+                try:
+                    writer = pd.ExcelWriter(
+                        file_path, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True}}
+                    )
+                except ImportError:
+                    df.to_excel(file_path, index=False)
+                else:
+                    with writer:
+                        df.to_excel(writer, index=False)
             elif ext == '.json':
-                with open(file_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                df.to_json(file_path, orient='records', indent=2)
             else:
                 logger.error(f"Unsupported file format: {ext}")
                 return
@@ -6,18 +6,40 @@ field requirements, data consistency rules, and format specifications.
 """
 
 from typing import Dict, List, Optional, Tuple, Any
+import operator
 import re
 import logging
+import numpy as np
 import pandas as pd
 from datetime import datetime
+try:
+    # numba compiles the bulk numeric sanity check to machine code
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
 
 from .asycuda_data_model import Declaration, Item, Entity
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _check_nonneg(arr):
+        """Per-element mask of values that are non-NaN and non-negative."""
+        out = np.empty(arr.shape[0], np.bool_)
+        for i in range(arr.shape[0]):
+            v = arr[i]
+            out[i] = (v == v) and (v >= 0.0)
+        return out
+else:
+    def _check_nonneg(arr):
+        """Per-element mask of values that are non-NaN and non-negative."""
+        return (arr == arr) & (arr >= 0.0)
+
+
 class ValidationError(Exception):
     """Exception raised for validation errors."""
     pass
@@ -27,11 +49,22 @@ class ValidationResult:
     """
     Represents the result of a validation operation.
     """
-    
+
+    # Message templates for record-based errors, keyed by error code; the
+    # message is only built when formatted_errors renders the records
+    _ERR_TEMPLATES = {
+        'required_missing': "Required field '{0}' is missing for item {1}",
+        'pattern_mismatch': "Value '{0}' does not match required pattern for {1}",
+        'too_long': "Field '{0}' exceeds maximum length of {1} characters",
+        'invalid_number': "Field '{0}' must be a valid number",
+        'negative_number': "Field '{0}' must be a positive number",
+        'net_exceeds_gross': "Net weight cannot exceed gross weight for item {0}",
+    }
+
     def __init__(self, is_valid: bool = True, errors: List[str] = None, warnings: List[str] = None):
         """
         Initialize validation result.
-        
+
         Args:
             is_valid: Whether the validation passed
             errors: List of error messages
@@ -40,43 +73,67 @@ class ValidationResult:
         self.is_valid = is_valid
         self.errors = errors or []
         self.warnings = warnings or []
-    
+        self.error_records: List[Tuple[str, tuple]] = []
+
     def add_error(self, error: str):
         """
         Add an error message and set is_valid to False.
-        
+
         Args:
             error: Error message
         """
         self.errors.append(error)
         self.is_valid = False
-    
+
+    def add_error_record(self, code: str, *args):
+        """
+        Record an error as (code, args) without building the message.
+
+        Bulk validators emit thousands of errors sharing a handful of
+        templates; appending the record and formatting only on display
+        avoids one f-string allocation per row.
+
+        Args:
+            code: Key into _ERR_TEMPLATES
+            *args: Positional values for the template
+        """
+        self.error_records.append((code, args))
+        self.is_valid = False
+
+    def formatted_errors(self) -> List[str]:
+        """All error messages as strings, with records rendered on demand."""
+        return self.errors + [
+            self._ERR_TEMPLATES[code].format(*args)
+            for code, args in self.error_records
+        ]
+
     def add_warning(self, warning: str):
         """
         Add a warning message.
-        
+
         Args:
             warning: Warning message
         """
         self.warnings.append(warning)
-    
+
     def merge(self, other: 'ValidationResult'):
         """
         Merge with another validation result.
-        
+
         Args:
             other: ValidationResult to merge with
         """
         self.is_valid = self.is_valid and other.is_valid
         self.errors.extend(other.errors)
+        self.error_records.extend(other.error_records)
         self.warnings.extend(other.warnings)
-    
+
     def __str__(self) -> str:
         """String representation of validation result."""
         status = "Valid" if self.is_valid else "Invalid"
-        error_count = len(self.errors)
+        error_count = len(self.errors) + len(self.error_records)
         warning_count = len(self.warnings)
-        
+
         return f"ValidationResult: {status} ({error_count} errors, {warning_count} warnings)"
 
 
@@ -109,8 +166,9 @@ class FieldValidator:
         'previous_document': 50,
     }
     
-    # Regular expression patterns
-    PATTERNS = {
+    # Regular expression patterns, compiled once at class creation so each
+    # validate_pattern call goes straight to the pattern's match method
+    _PATTERNS = {name: re.compile(pattern) for name, pattern in {
         'registration_number': r'^[A-Z0-9]+$',
         'declaration_type': r'^EX[1-3]$',
         'customs_office': r'^LC[A-Z]{2,3}$',
@@ -121,28 +179,56 @@ class FieldValidator:
         'hs_code': r'^\d{6,10}$',
         'numeric': r'^\d+(\.\d+)?$',
         'date': r'^\d{2}/\d{2}/\d{4}$',
+    }.items()}
+
+    # Hand-written checks for the fixed-shape codes; equivalent to the
+    # patterns above but without entering the regex engine. Patterns not
+    # listed here (numeric, date) fall through to the compiled regex.
+    _FAST_CHECKS = {
+        'registration_number':
+            lambda v: bool(v) and v.isascii() and v.isalnum()
+            and (v.isupper() or v.isdigit()),
+        'declaration_type':
+            lambda v: len(v) == 3 and v[:2] == 'EX' and v[2] in '123',
+        'customs_office':
+            lambda v: 4 <= len(v) <= 5 and v[:2] == 'LC'
+            and v[2:].isascii() and v[2:].isalpha() and v[2:].isupper(),
+        'general_procedure_code':
+            lambda v: len(v) == 4 and v.isascii() and v.isdigit(),
+        'extended_procedure_code':
+            lambda v: len(v) == 3 and v.isascii() and v.isdigit(),
+        'country_code':
+            lambda v: len(v) == 2 and v.isascii() and v.isalpha() and v.isupper(),
+        'currency_code':
+            lambda v: len(v) == 3 and v.isascii() and v.isalpha() and v.isupper(),
+        'hs_code':
+            lambda v: 6 <= len(v) <= 10 and v.isascii() and v.isdigit(),
     }
-    
+
+    @classmethod
+    def _validate_length_into(cls, field_name: str, value: str, errors: List[str]) -> None:
+        """Append a length error for field_name directly to errors."""
+        max_length = cls.MAX_LENGTHS.get(field_name)
+        if max_length and len(str(value)) > max_length:
+            errors.append(
+                f"Field '{field_name}' exceeds maximum length of {max_length} characters"
+            )
+
     @classmethod
     def validate_length(cls, field_name: str, value: str) -> ValidationResult:
         """
         Validate field length against maximum allowed.
-        
+
         Args:
             field_name: Name of the field to validate
             value: Value to validate
-            
+
         Returns:
             ValidationResult
         """
         result = ValidationResult()
-        
-        max_length = cls.MAX_LENGTHS.get(field_name)
-        if max_length and len(str(value)) > max_length:
-            result.add_error(
-                f"Field '{field_name}' exceeds maximum length of {max_length} characters"
-            )
-        
+        cls._validate_length_into(field_name, value, result.errors)
+        result.is_valid = not result.errors
         return result
     
     @classmethod
@@ -158,14 +244,26 @@ class FieldValidator:
             ValidationResult
         """
         result = ValidationResult()
-        
-        pattern = cls.PATTERNS.get(pattern_name)
-        if pattern and not re.match(pattern, str(value)):
-            result.add_error(
+        cls._validate_pattern_into(pattern_name, value, result.errors)
+        result.is_valid = not result.errors
+        return result
+
+    @classmethod
+    def _validate_pattern_into(cls, pattern_name: str, value: str, errors: List[str]) -> None:
+        """Append a pattern error for pattern_name directly to errors."""
+        fast_check = cls._FAST_CHECKS.get(pattern_name)
+        if fast_check is not None:
+            if not fast_check(str(value)):
+                errors.append(
+                    f"Value '{value}' does not match required pattern for {pattern_name}"
+                )
+            return
+
+        pattern = cls._PATTERNS.get(pattern_name)
+        if pattern is not None and pattern.match(str(value)) is None:
+            errors.append(
                 f"Value '{value}' does not match required pattern for {pattern_name}"
             )
-        
-        return result
     
     @classmethod
     def validate_numeric(cls, field_name: str, value: Any) -> ValidationResult:
@@ -180,19 +278,22 @@ class FieldValidator:
             ValidationResult
         """
         result = ValidationResult()
-        
+        cls._validate_numeric_into(field_name, value, result.errors)
+        result.is_valid = not result.errors
+        return result
+
+    @classmethod
+    def _validate_numeric_into(cls, field_name: str, value: Any, errors: List[str]) -> None:
+        """Append a numeric error for field_name directly to errors."""
         try:
-            float_value = float(value)
-            if float_value < 0:
-                result.add_error(
+            if float(value) < 0:
+                errors.append(
                     f"Field '{field_name}' must be a positive number"
                 )
         except (ValueError, TypeError):
-            result.add_error(
+            errors.append(
                 f"Field '{field_name}' must be a valid number"
             )
-        
-        return result
     
     @classmethod
     def validate_date(cls, field_name: str, value: Any) -> ValidationResult:
@@ -207,28 +308,41 @@ class FieldValidator:
             ValidationResult
         """
         result = ValidationResult()
-        
+        cls._validate_date_into(field_name, value, result.errors)
+        result.is_valid = not result.errors
+        return result
+
+    @classmethod
+    def _validate_date_into(cls, field_name: str, value: Any, errors: List[str]) -> None:
+        """Append a date error for field_name directly to errors."""
         if isinstance(value, datetime):
-            return result
-        
+            return
+
         if isinstance(value, str):
+            # Try DD/MM/YYYY first: shape-check by slicing and convert the
+            # pieces directly instead of a regex pass followed by split.
+            # isdecimal guards each piece because int() alone would accept
+            # leading whitespace and signs the old regex rejected
+            if (len(value) == 10 and value[2] == '/' and value[5] == '/'
+                    and value[0:2].isdecimal() and value[3:5].isdecimal()
+                    and value[6:10].isdecimal()):
+                try:
+                    datetime(int(value[6:10]), int(value[3:5]), int(value[0:2]))
+                    return
+                except ValueError:
+                    pass
+            # Try ISO format, only rewriting the 'Z' suffix when present
             try:
-                # Try to parse date string in DD/MM/YYYY format
-                if re.match(r'^\d{2}/\d{2}/\d{4}$', value):
-                    day, month, year = map(int, value.split('/'))
-                    datetime(year, month, day)
-                    return result
-                # Try to parse ISO format
-                datetime.fromisoformat(value.replace('Z', '+00:00'))
-                return result
+                datetime.fromisoformat(
+                    value[:-1] + '+00:00' if value.endswith('Z') else value
+                )
+                return
             except (ValueError, TypeError):
                 pass
-        
-        result.add_error(
+
+        errors.append(
             f"Field '{field_name}' must be a valid date"
         )
-        
-        return result
 
 
 class DeclarationValidator:
@@ -236,10 +350,72 @@ class DeclarationValidator:
     Validates ASYCUDA declarations against field requirements and data consistency rules.
     """
     
+    # Item fields checked by the vectorized validator
+    _ITEM_REQUIRED_FIELDS = (
+        'hs_code',
+        'description',
+        'country_of_origin',
+        'gross_weight',
+        'net_weight',
+        'statistical_unit',
+        'quantity',
+        'customs_value',
+        'package_type',
+        'package_count',
+    )
+    _ITEM_NUMERIC_FIELDS = (
+        'gross_weight',
+        'net_weight',
+        'quantity',
+        'customs_value',
+        'package_count',
+    )
+
+    # Required header fields, with a C-level batched getter; attrgetter
+    # fetches the whole tuple in one call instead of a getattr per field
+    _HEADER_REQUIRED = (
+        'registration_number',
+        'declaration_type',
+        'customs_office',
+        'general_procedure_code',
+        'extended_procedure_code',
+        'country_of_destination',
+        'mode_of_transport',
+        'office_of_entry_exit',
+        'currency_code',
+        'exchange_rate',
+        'date',
+    )
+    _HEADER_GETTER = operator.attrgetter(*_HEADER_REQUIRED)
+    _ITEM_GETTER = operator.attrgetter(*_ITEM_REQUIRED_FIELDS)
+    _ENTITY_REQUIRED = ('id', 'name', 'address_line1')
+    _ENTITY_GETTER = operator.attrgetter(*_ENTITY_REQUIRED)
+
+    @staticmethod
+    def _get_fields(obj: Any, getter: operator.attrgetter, fields: Tuple[str, ...]) -> Tuple:
+        """Fetch fields in one batched call, treating missing ones as None."""
+        try:
+            return getter(obj)
+        except AttributeError:
+            return tuple(getattr(obj, field, None) for field in fields)
+
+    # Header format checks as one declarative table:
+    # (field, length key or None, pattern key or None, numeric flag)
+    _HEADER_SPEC = (
+        ('registration_number', 'registration_number', 'registration_number', False),
+        ('declaration_type', None, 'declaration_type', False),
+        ('customs_office', None, 'customs_office', False),
+        ('general_procedure_code', None, 'general_procedure_code', False),
+        ('extended_procedure_code', None, 'extended_procedure_code', False),
+        ('country_of_destination', None, 'country_code', False),
+        ('currency_code', None, 'currency_code', False),
+        ('exchange_rate', None, None, True),
+    )
+
     def __init__(self):
         """Initialize the declaration validator."""
         pass
-    
+
     def validate_declaration(self, declaration: Declaration) -> ValidationResult:
         """
         Validate a complete declaration.
@@ -250,7 +426,7 @@ class DeclarationValidator:
         Returns:
             ValidationResult
         """
-        logger.info(f"Validating declaration {declaration.registration_number}")
+        logger.info("Validating declaration %s", declaration.registration_number)
         
         result = ValidationResult()
         
@@ -266,17 +442,92 @@ class DeclarationValidator:
         declarant_result = self._validate_entity(declaration.declarant, "declarant")
         result.merge(declarant_result)
         
-        # Validate items
-        for idx, item in enumerate(declaration.items):
-            item_result = self._validate_item(item, idx + 1)
-            result.merge(item_result)
-        
+        # Validate items in one column-oriented pass
+        items_result = self._validate_items_vectorized(declaration.items)
+        result.merge(items_result)
+
         # Validate cross-field consistency
         consistency_result = self._validate_consistency(declaration)
         result.merge(consistency_result)
-        
+
         return result
-    
+
+    def _validate_items_vectorized(self, items: List[Item]) -> ValidationResult:
+        """
+        Validate all declaration items with column-oriented checks.
+
+        Equivalent to running _validate_item over every item, but each rule
+        is evaluated once as a vector operation over a DataFrame view of the
+        items instead of per-item attribute probing.
+
+        Args:
+            items: Items to validate
+
+        Returns:
+            ValidationResult
+        """
+        result = ValidationResult()
+
+        if not items:
+            return result
+
+        df = pd.DataFrame([item.__dict__ for item in items])
+
+        # Required fields present and non-empty
+        for field in self._ITEM_REQUIRED_FIELDS:
+            if field not in df.columns:
+                for item_number in range(1, len(items) + 1):
+                    result.add_error_record('required_missing', field, item_number)
+                continue
+            column = df[field]
+            missing = column.isna() | (column == '')
+            for idx in np.flatnonzero(missing.to_numpy()):
+                result.add_error_record('required_missing', field, idx + 1)
+
+        # Pattern checks on the fixed-shape code columns
+        for field, pattern_name, pattern in (
+            ('hs_code', 'hs_code', r'\d{6,10}'),
+            ('country_of_origin', 'country_code', r'[A-Z]{2}'),
+        ):
+            if field not in df.columns:
+                continue
+            column = df[field]
+            values = column[column.notna() & (column != '')].astype(str)
+            for value in values[~values.str.fullmatch(pattern)]:
+                result.add_error_record('pattern_mismatch', value, pattern_name)
+
+        # Description length
+        if 'description' in df.columns:
+            column = df['description']
+            values = column[column.notna() & (column != '')].astype(str)
+            max_length = FieldValidator.MAX_LENGTHS['description']
+            for _ in range(int((values.str.len() > max_length).sum())):
+                result.add_error_record('too_long', 'description', max_length)
+
+        # Numeric fields parse and are non-negative; the non-negativity mask
+        # runs through the compiled kernel when numba is available
+        for field in self._ITEM_NUMERIC_FIELDS:
+            if field not in df.columns:
+                continue
+            column = df[field]
+            numeric = pd.to_numeric(column[column.notna()], errors='coerce')
+            arr = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+            ok = _check_nonneg(arr)
+            invalid = arr != arr  # unparseable cells coerced to NaN
+            for _ in range(int(invalid.sum())):
+                result.add_error_record('invalid_number', field)
+            for _ in range(int((~ok & ~invalid).sum())):
+                result.add_error_record('negative_number', field)
+
+        # Cross-field check: net weight must not exceed gross weight
+        if 'gross_weight' in df.columns and 'net_weight' in df.columns:
+            gross = pd.to_numeric(df['gross_weight'], errors='coerce')
+            net = pd.to_numeric(df['net_weight'], errors='coerce')
+            for idx in np.flatnonzero((net > gross).to_numpy()):
+                result.add_error_record('net_exceeds_gross', idx + 1)
+
+        return result
+
     def _validate_header(self, declaration: Declaration) -> ValidationResult:
         """
         Validate declaration header fields.
@@ -288,66 +539,33 @@ class DeclarationValidator:
             ValidationResult
         """
         result = ValidationResult()
-        
-        # Check required fields
-        required_fields = [
-            'registration_number',
-            'declaration_type',
-            'customs_office',
-            'general_procedure_code',
-            'extended_procedure_code',
-            'country_of_destination',
-            'mode_of_transport',
-            'office_of_entry_exit',
-            'currency_code',
-            'exchange_rate',
-            'date',
-        ]
-        
-        for field in required_fields:
-            if not hasattr(declaration, field) or getattr(declaration, field) is None or getattr(declaration, field) == '':
+
+        # Check required fields, fetched as one batched tuple
+        values = self._get_fields(declaration, self._HEADER_GETTER, self._HEADER_REQUIRED)
+        for field, value in zip(self._HEADER_REQUIRED, values):
+            if value is None or value == '':
                 result.add_error(f"Required field '{field}' is missing")
         
-        # Validate field formats
-        if hasattr(declaration, 'registration_number') and declaration.registration_number:
-            length_result = FieldValidator.validate_length('registration_number', declaration.registration_number)
-            result.merge(length_result)
-            
-            pattern_result = FieldValidator.validate_pattern('registration_number', declaration.registration_number)
-            result.merge(pattern_result)
-        
-        if hasattr(declaration, 'declaration_type') and declaration.declaration_type:
-            pattern_result = FieldValidator.validate_pattern('declaration_type', declaration.declaration_type)
-            result.merge(pattern_result)
-        
-        if hasattr(declaration, 'customs_office') and declaration.customs_office:
-            pattern_result = FieldValidator.validate_pattern('customs_office', declaration.customs_office)
-            result.merge(pattern_result)
-        
-        if hasattr(declaration, 'general_procedure_code') and declaration.general_procedure_code:
-            pattern_result = FieldValidator.validate_pattern('general_procedure_code', declaration.general_procedure_code)
-            result.merge(pattern_result)
-        
-        if hasattr(declaration, 'extended_procedure_code') and declaration.extended_procedure_code:
-            pattern_result = FieldValidator.validate_pattern('extended_procedure_code', declaration.extended_procedure_code)
-            result.merge(pattern_result)
-        
-        if hasattr(declaration, 'country_of_destination') and declaration.country_of_destination:
-            pattern_result = FieldValidator.validate_pattern('country_code', declaration.country_of_destination)
-            result.merge(pattern_result)
-        
-        if hasattr(declaration, 'currency_code') and declaration.currency_code:
-            pattern_result = FieldValidator.validate_pattern('currency_code', declaration.currency_code)
-            result.merge(pattern_result)
-        
-        if hasattr(declaration, 'exchange_rate') and declaration.exchange_rate is not None:
-            numeric_result = FieldValidator.validate_numeric('exchange_rate', declaration.exchange_rate)
-            result.merge(numeric_result)
-        
+        # Validate field formats in one pass over the declarative spec; all
+        # checks append into the one shared error list rather than merging a
+        # throwaway ValidationResult per check
+        errors = result.errors
+        for field, length_key, pattern_key, numeric in self._HEADER_SPEC:
+            value = getattr(declaration, field, None)
+            if value is None or (not numeric and not value):
+                continue
+            if length_key:
+                FieldValidator._validate_length_into(length_key, value, errors)
+            if pattern_key:
+                FieldValidator._validate_pattern_into(pattern_key, value, errors)
+            if numeric:
+                FieldValidator._validate_numeric_into(field, value, errors)
+
         # Check for items
         if not declaration.items:
             result.add_error("Declaration must have at least one item")
-        
+
+        result.is_valid = not result.errors
         return result
     
     def _validate_entity(self, entity: Entity, entity_type: str) -> ValidationResult:
@@ -362,27 +580,31 @@ class DeclarationValidator:
             ValidationResult
         """
         result = ValidationResult()
-        
+
+        # Fetch the fields as one batched tuple; the captured values feed
+        # both the required check and the format checks below
+        entity_id, name, address_line1 = self._get_fields(
+            entity, self._ENTITY_GETTER, self._ENTITY_REQUIRED)
+
         # Check required fields
-        required_fields = ['id', 'name', 'address_line1']
-        
-        for field in required_fields:
-            if not hasattr(entity, field) or getattr(entity, field) is None or getattr(entity, field) == '':
+        for field, value in zip(self._ENTITY_REQUIRED,
+                                (entity_id, name, address_line1)):
+            if value is None or value == '':
                 result.add_error(f"Required field '{field}' is missing for {entity_type}")
-        
+
         # Validate field formats
-        if hasattr(entity, 'id') and entity.id:
-            length_result = FieldValidator.validate_length(f'{entity_type}_id', entity.id)
-            result.merge(length_result)
-        
-        if hasattr(entity, 'name') and entity.name:
-            length_result = FieldValidator.validate_length(f'{entity_type}_name', entity.name)
-            result.merge(length_result)
-        
-        if hasattr(entity, 'country') and entity.country:
-            pattern_result = FieldValidator.validate_pattern('country_code', entity.country)
-            result.merge(pattern_result)
-        
+        errors = result.errors
+        if entity_id:
+            FieldValidator._validate_length_into(f'{entity_type}_id', entity_id, errors)
+
+        if name:
+            FieldValidator._validate_length_into(f'{entity_type}_name', name, errors)
+
+        country = getattr(entity, 'country', None)
+        if country:
+            FieldValidator._validate_pattern_into('country_code', country, errors)
+
+        result.is_valid = not result.errors
         return result
     
     def _validate_item(self, item: Item, item_number: int) -> ValidationResult:
@@ -397,58 +619,34 @@ class DeclarationValidator:
             ValidationResult
         """
         result = ValidationResult()
-        
+
+        # Fetch the fields as one batched tuple; the captured values feed
+        # both the required check and the format checks below
+        values = dict(zip(
+            self._ITEM_REQUIRED_FIELDS,
+            self._get_fields(item, self._ITEM_GETTER, self._ITEM_REQUIRED_FIELDS)
+        ))
+
         # Check required fields
-        required_fields = [
-            'hs_code',
-            'description',
-            'country_of_origin',
-            'gross_weight',
-            'net_weight',
-            'statistical_unit',
-            'quantity',
-            'customs_value',
-            'package_type',
-            'package_count',
-        ]
-        
-        for field in required_fields:
-            if not hasattr(item, field) or getattr(item, field) is None or getattr(item, field) == '':
+        for field, value in values.items():
+            if value is None or value == '':
                 result.add_error(f"Required field '{field}' is missing for item {item_number}")
-        
+
         # Validate field formats
-        if hasattr(item, 'hs_code') and item.hs_code:
-            pattern_result = FieldValidator.validate_pattern('hs_code', item.hs_code)
-            result.merge(pattern_result)
-        
-        if hasattr(item, 'description') and item.description:
-            length_result = FieldValidator.validate_length('description', item.description)
-            result.merge(length_result)
-        
-        if hasattr(item, 'country_of_origin') and item.country_of_origin:
-            pattern_result = FieldValidator.validate_pattern('country_code', item.country_of_origin)
-            result.merge(pattern_result)
-        
-        if hasattr(item, 'gross_weight') and item.gross_weight is not None:
-            numeric_result = FieldValidator.validate_numeric('gross_weight', item.gross_weight)
-            result.merge(numeric_result)
-        
-        if hasattr(item, 'net_weight') and item.net_weight is not None:
-            numeric_result = FieldValidator.validate_numeric('net_weight', item.net_weight)
-            result.merge(numeric_result)
-        
-        if hasattr(item, 'quantity') and item.quantity is not None:
-            numeric_result = FieldValidator.validate_numeric('quantity', item.quantity)
-            result.merge(numeric_result)
-        
-        if hasattr(item, 'customs_value') and item.customs_value is not None:
-            numeric_result = FieldValidator.validate_numeric('customs_value', item.customs_value)
-            result.merge(numeric_result)
-        
-        if hasattr(item, 'package_count') and item.package_count is not None:
-            numeric_result = FieldValidator.validate_numeric('package_count', item.package_count)
-            result.merge(numeric_result)
-        
+        errors = result.errors
+        if values['hs_code']:
+            FieldValidator._validate_pattern_into('hs_code', values['hs_code'], errors)
+
+        if values['description']:
+            FieldValidator._validate_length_into('description', values['description'], errors)
+
+        if values['country_of_origin']:
+            FieldValidator._validate_pattern_into('country_code', values['country_of_origin'], errors)
+
+        for field in self._ITEM_NUMERIC_FIELDS:
+            if values[field] is not None:
+                FieldValidator._validate_numeric_into(field, values[field], errors)
+
         # Cross-field validations
         if (hasattr(item, 'gross_weight') and item.gross_weight is not None and 
             hasattr(item, 'net_weight') and item.net_weight is not None):
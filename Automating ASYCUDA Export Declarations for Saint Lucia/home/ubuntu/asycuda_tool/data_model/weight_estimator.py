@@ -9,9 +9,14 @@ from typing import Dict, List, Optional, Tuple, Any
 import re
 import logging
 import pandas as pd
+try:
+    # pyahocorasick scans all keywords in one C-level pass
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -22,63 +27,90 @@ class WeightEstimator:
     
     def __init__(self):
         """Initialize the weight estimator with default weight mappings."""
-        # Default weights by HS code prefix (kg)
+        # Default (gross, net) weights by HS code prefix (kg); flat tuples
+        # avoid a per-field dict hash on every lookup
         self.default_weights = {
             # Clothing
-            '6205': {'gross': 0.3, 'net': 0.25},  # Shirts
-            '6206': {'gross': 0.2, 'net': 0.15},  # Women's blouses
-            '6203': {'gross': 0.5, 'net': 0.45},  # Men's suits, pants
-            '6204': {'gross': 0.4, 'net': 0.35},  # Women's suits, dresses
-            '6211': {'gross': 0.3, 'net': 0.25},  # Swimwear
-            '6208': {'gross': 0.1, 'net': 0.08},  # Women's undergarments
+            '6205': (0.3, 0.25),  # Shirts
+            '6206': (0.2, 0.15),  # Women's blouses
+            '6203': (0.5, 0.45),  # Men's suits, pants
+            '6204': (0.4, 0.35),  # Women's suits, dresses
+            '6211': (0.3, 0.25),  # Swimwear
+            '6208': (0.1, 0.08),  # Women's undergarments
             
             # Headwear
-            '6504': {'gross': 0.2, 'net': 0.15},  # Hats and caps
+            '6504': (0.2, 0.15),  # Hats and caps
             
             # Bags
-            '4202': {'gross': 0.5, 'net': 0.45},  # Bags, wallets
+            '4202': (0.5, 0.45),  # Bags, wallets
             
             # Footwear
-            '6402': {'gross': 0.6, 'net': 0.5},  # Footwear with outer soles
-            '6405': {'gross': 0.5, 'net': 0.4},  # Other footwear
+            '6402': (0.6, 0.5),  # Footwear with outer soles
+            '6405': (0.5, 0.4),  # Other footwear
             
             # Jewelry
-            '7117': {'gross': 0.05, 'net': 0.03},  # Imitation jewelry
+            '7117': (0.05, 0.03),  # Imitation jewelry
             
             # Default for unknown categories
-            'default': {'gross': 0.3, 'net': 0.25}
+            'default': (0.3, 0.25)
         }
         
         # Keyword-based weight estimates
         self.keyword_weights = {
-            'SHIRT': {'gross': 0.3, 'net': 0.25},
-            'BLOUSE': {'gross': 0.2, 'net': 0.15},
-            'PANT': {'gross': 0.5, 'net': 0.45},
-            'SHORT': {'gross': 0.3, 'net': 0.25},
-            'DRESS': {'gross': 0.4, 'net': 0.35},
-            'SWIMSUIT': {'gross': 0.3, 'net': 0.25},
-            'BIKINI': {'gross': 0.2, 'net': 0.15},
-            'HAT': {'gross': 0.2, 'net': 0.15},
-            'CAP': {'gross': 0.2, 'net': 0.15},
-            'VISOR': {'gross': 0.15, 'net': 0.1},
-            'BAG': {'gross': 0.5, 'net': 0.45},
-            'CROSSBODY': {'gross': 0.4, 'net': 0.35},
-            'CLUTCH': {'gross': 0.3, 'net': 0.25},
-            'SANDAL': {'gross': 0.5, 'net': 0.4},
-            'SHOE': {'gross': 0.6, 'net': 0.5},
-            'BRACELET': {'gross': 0.05, 'net': 0.03},
-            'NECKLACE': {'gross': 0.05, 'net': 0.03},
-            'EARRING': {'gross': 0.02, 'net': 0.01},
-            'RING': {'gross': 0.02, 'net': 0.01},
-            'SCRUNCHIE': {'gross': 0.05, 'net': 0.03},
-            'SARONG': {'gross': 0.3, 'net': 0.25},
-            'PAREO': {'gross': 0.3, 'net': 0.25},
-            'TUNIC': {'gross': 0.3, 'net': 0.25},
-            'TOP': {'gross': 0.2, 'net': 0.15},
-            'BOTTOM': {'gross': 0.3, 'net': 0.25},
-            'RASHGUARD': {'gross': 0.3, 'net': 0.25}
+            'SHIRT': (0.3, 0.25),
+            'BLOUSE': (0.2, 0.15),
+            'PANT': (0.5, 0.45),
+            'SHORT': (0.3, 0.25),
+            'DRESS': (0.4, 0.35),
+            'SWIMSUIT': (0.3, 0.25),
+            'BIKINI': (0.2, 0.15),
+            'HAT': (0.2, 0.15),
+            'CAP': (0.2, 0.15),
+            'VISOR': (0.15, 0.1),
+            'BAG': (0.5, 0.45),
+            'CROSSBODY': (0.4, 0.35),
+            'CLUTCH': (0.3, 0.25),
+            'SANDAL': (0.5, 0.4),
+            'SHOE': (0.6, 0.5),
+            'BRACELET': (0.05, 0.03),
+            'NECKLACE': (0.05, 0.03),
+            'EARRING': (0.02, 0.01),
+            'RING': (0.02, 0.01),
+            'SCRUNCHIE': (0.05, 0.03),
+            'SARONG': (0.3, 0.25),
+            'PAREO': (0.3, 0.25),
+            'TUNIC': (0.3, 0.25),
+            'TOP': (0.2, 0.15),
+            'BOTTOM': (0.3, 0.25),
+            'RASHGUARD': (0.3, 0.25)
         }
-    
+
+        self._keyword_automaton = None
+        self._build_keyword_automaton()
+
+        self._weights_by_2 = {}
+        self._rebuild_prefix_index()
+
+    def _rebuild_prefix_index(self):
+        """Rebuild the 2-digit prefix fallback index from default_weights."""
+        index = {}
+        for prefix, weights in self.default_weights.items():
+            # First entry per 2-digit prefix wins, matching the
+            # insertion-order scan this index replaces
+            if prefix != 'default':
+                index.setdefault(prefix[:2], weights)
+        self._weights_by_2 = index
+
+    def _build_keyword_automaton(self):
+        """Compile keyword_weights into an Aho-Corasick automaton."""
+        if not AHOCORASICK_AVAILABLE:
+            return
+        automaton = ahocorasick.Automaton()
+        for keyword, weights in self.keyword_weights.items():
+            automaton.add_word(keyword, (keyword, weights))
+        automaton.make_automaton()
+        self._keyword_automaton = automaton
+
     def add_weight_mapping(self, hs_prefix: str, gross: float, net: float):
         """
         Add a weight mapping for an HS code prefix.
@@ -88,7 +120,8 @@ class WeightEstimator:
             gross: Gross weight in kg
             net: Net weight in kg
         """
-        self.default_weights[hs_prefix] = {'gross': gross, 'net': net}
+        self.default_weights[hs_prefix] = (gross, net)
+        self._weights_by_2.setdefault(hs_prefix[:2], (gross, net))
     
     def add_keyword_mapping(self, keyword: str, gross: float, net: float):
         """
@@ -99,7 +132,8 @@ class WeightEstimator:
             gross: Gross weight in kg
             net: Net weight in kg
         """
-        self.keyword_weights[keyword.upper()] = {'gross': gross, 'net': net}
+        self.keyword_weights[keyword.upper()] = (gross, net)
+        self._build_keyword_automaton()
     
     def load_weight_mappings_from_dataframe(self, df: pd.DataFrame, 
                                           hs_col: str, 
@@ -114,92 +148,118 @@ class WeightEstimator:
             gross_col: Column name for gross weights
             net_col: Column name for net weights
         """
-        for _, row in df.iterrows():
-            try:
-                hs_code = str(row[hs_col]).strip()
-                gross = float(row[gross_col])
-                net = float(row[net_col])
-                
-                if len(hs_code) >= 4:
-                    hs_prefix = hs_code[:4]
-                    self.add_weight_mapping(hs_prefix, gross, net)
-            except Exception as e:
-                logger.warning(f"Error loading weight mapping: {e}")
+        # Clean each column once instead of boxing a Series per row; rows
+        # with short codes or non-numeric weights drop out of the mask
+        hs_codes = df[hs_col].fillna('').astype(str).str.strip()
+        gross = pd.to_numeric(df[gross_col], errors='coerce')
+        net = pd.to_numeric(df[net_col], errors='coerce')
+
+        mask = (hs_codes.str.len() >= 4) & gross.notna() & net.notna()
+
+        self.default_weights.update({
+            hs_code[:4]: (g, n)
+            for hs_code, g, n in zip(hs_codes[mask].tolist(),
+                                     gross[mask].tolist(), net[mask].tolist())
+        })
+
+        skipped = int((~mask).sum())
+        if skipped:
+            logger.warning("Skipped %d weight mapping rows with invalid data", skipped)
+
+        self._rebuild_prefix_index()
     
-    def estimate_by_hs_code(self, hs_code: str) -> Dict[str, float]:
+    def estimate_by_hs_code(self, hs_code: str) -> Tuple[float, float]:
         """
         Estimate weights based on HS code.
-        
+
         Args:
             hs_code: HS code of the product
-            
+
         Returns:
-            Dictionary with gross and net weights
+            Tuple of (gross, net) weights
         """
         if not hs_code:
             return self.default_weights['default']
-        
-        # Try to match by HS code prefix (first 4 digits)
-        for prefix_length in [4, 2]:
-            if len(hs_code) >= prefix_length:
-                prefix = hs_code[:prefix_length]
-                for mapping_prefix, weights in self.default_weights.items():
-                    if mapping_prefix.startswith(prefix):
-                        return weights
-        
+
+        # Direct lookups: exact 4-digit entry, then the 2-digit fallback
+        # index, then the default
+        weights = self.default_weights.get(hs_code[:4])
+        if weights is not None:
+            return weights
+
+        weights = self._weights_by_2.get(hs_code[:2])
+        if weights is not None:
+            return weights
+
         # Default fallback
         return self.default_weights['default']
     
-    def estimate_by_description(self, description: str) -> Dict[str, float]:
+    def estimate_by_description(self, description: str) -> Tuple[float, float]:
         """
         Estimate weights based on product description.
-        
+
         Args:
             description: Product description
-            
+
         Returns:
-            Dictionary with gross and net weights
+            Tuple of (gross, net) weights
         """
         if not description:
             return self.default_weights['default']
         
         description_upper = description.upper()
-        
+
+        if self._keyword_automaton is not None:
+            # Single automaton pass; keep the longest keyword so 'EARRING'
+            # wins over the embedded 'RING'
+            best_keyword = None
+            best_weights = None
+            for _, (keyword, weights) in self._keyword_automaton.iter(description_upper):
+                if best_keyword is None or len(keyword) > len(best_keyword):
+                    best_keyword = keyword
+                    best_weights = weights
+            if best_weights is not None:
+                return best_weights
+            return self.default_weights['default']
+
         # Check for keywords in the description
         for keyword, weights in self.keyword_weights.items():
             if keyword in description_upper:
                 return weights
-        
+
         # Default fallback
         return self.default_weights['default']
     
-    def estimate_weights(self, hs_code: Optional[str] = None, description: Optional[str] = None, quantity: float = 1.0) -> Dict[str, float]:
+    def estimate_weights(self, hs_code: Optional[str] = None, description: Optional[str] = None, quantity: float = 1.0) -> Tuple[float, float]:
         """
         Estimate gross and net weights for a product.
-        
+
         Args:
             hs_code: HS code of the product
             description: Product description for additional context
             quantity: Quantity of the product
-            
+
         Returns:
-            Dictionary with gross and net weights
+            Tuple of (gross, net) weights, usable as
+            ``gross, net = estimator.estimate_weights(...)``
         """
         # Try HS code-based estimation first
         if hs_code:
-            weights = self.estimate_by_hs_code(hs_code)
+            gross, net = self.estimate_by_hs_code(hs_code)
         # Fall back to description-based estimation
         elif description:
-            weights = self.estimate_by_description(description)
+            gross, net = self.estimate_by_description(description)
         # Use default weights if neither is available
         else:
-            weights = self.default_weights['default']
-        
+            gross, net = self.default_weights['default']
+
         # Adjust for quantity
-        return {
-            'gross': weights['gross'] * quantity,
-            'net': weights['net'] * quantity
-        }
+        return (gross * quantity, net * quantity)
+
+    @staticmethod
+    def _as_dict(weights: Tuple[float, float]) -> Dict[str, float]:
+        """Convert a (gross, net) weight tuple to the legacy dict form."""
+        return {'gross': weights[0], 'net': weights[1]}
     
     def analyze_product_weights(self, products_df: pd.DataFrame, 
                               description_col: str, 
@@ -217,20 +277,50 @@ class WeightEstimator:
         """
         # Create a copy to avoid modifying the original
         result_df = products_df.copy()
-        
-        # Add weight columns
-        result_df['estimated_gross_weight'] = 0.0
-        result_df['estimated_net_weight'] = 0.0
-        
-        # Process each product
-        for idx, row in result_df.iterrows():
-            description = str(row[description_col]) if not pd.isna(row[description_col]) else ""
-            hs_code = str(row[hs_code_col]) if hs_code_col and not pd.isna(row[hs_code_col]) else None
-            quantity = float(row['quantity']) if 'quantity' in row and not pd.isna(row['quantity']) else 1.0
-            
-            weights = self.estimate_weights(hs_code, description, quantity)
-            
-            result_df.at[idx, 'estimated_gross_weight'] = weights['gross']
-            result_df.at[idx, 'estimated_net_weight'] = weights['net']
-        
+
+        default_gross, default_net = self.default_weights['default']
+
+        # Keyword pass: one regex alternation over the whole description
+        # column, longest keyword first so the most specific hit wins
+        descriptions = result_df[description_col].fillna('').astype(str).str.upper()
+        pattern = '(' + '|'.join(
+            re.escape(keyword)
+            for keyword in sorted(self.keyword_weights, key=len, reverse=True)
+        ) + ')'
+        hits = descriptions.str.extract(pattern, expand=False)
+        gross = hits.map({k: w[0] for k, w in self.keyword_weights.items()}).fillna(default_gross)
+        net = hits.map({k: w[1] for k, w in self.keyword_weights.items()}).fillna(default_net)
+
+        # HS pass: rows with a code use prefix lookups instead, matching
+        # estimate_weights' preference for HS-based estimates
+        if hs_code_col:
+            hs_codes = result_df[hs_code_col].fillna('').astype(str).str.strip()
+            has_hs = hs_codes != ''
+            if has_hs.any():
+                prefix_weights = {k: v for k, v in self.default_weights.items()
+                                  if k != 'default'}
+                p2_weights = {}
+                for prefix, weights in prefix_weights.items():
+                    p2_weights.setdefault(prefix[:2], weights)
+
+                p4 = hs_codes.str[:4]
+                p2 = hs_codes.str[:2]
+                hs_gross = (p4.map({k: v[0] for k, v in prefix_weights.items()})
+                            .fillna(p2.map({k: v[0] for k, v in p2_weights.items()}))
+                            .fillna(default_gross))
+                hs_net = (p4.map({k: v[1] for k, v in prefix_weights.items()})
+                          .fillna(p2.map({k: v[1] for k, v in p2_weights.items()}))
+                          .fillna(default_net))
+                gross = gross.where(~has_hs, hs_gross)
+                net = net.where(~has_hs, hs_net)
+
+        # Adjust for quantity where available
+        if 'quantity' in result_df.columns:
+            quantity = pd.to_numeric(result_df['quantity'], errors='coerce').fillna(1.0)
+            gross = gross * quantity
+            net = net * quantity
+
+        result_df['estimated_gross_weight'] = gross
+        result_df['estimated_net_weight'] = net
+
         return result_df